@@ -32,6 +32,7 @@ urlpatterns = [
     path('api/reviews/', include('reviews.urls', namespace='reviews')),
     path('api/', include('journals.urls')),
     path('api/book/', include('book.urls')),
+    path('progress/', include('userbooks.urls')),
 ]
 
 if settings.DEBUG:
@@ -477,7 +477,8 @@ class Shelf (models.Model):
         verbose_name_plural = "Shelves"
         indexes = [
             models.Index(fields=["name"]),
-            models.Index(fields=["shelf_type"])
+            models.Index(fields=["shelf_type"]),
+            models.Index(fields=["user", "shelf_type"])
         ]
         ordering = ["name"]
 
@@ -1,4 +1,6 @@
 from rest_framework import serializers
+from rest_framework.settings import api_settings
+from django.db import IntegrityError
 from library.models import Shelf, ShelfEdition, Edition
 
 class ShelfSerializer(serializers.ModelSerializer):
@@ -36,49 +38,82 @@ class AddEditionToShelfSerializer(serializers.Serializer):
     
     This serializer validates that:
     1. The edition exists
-    2. The edition is not already on this shelf
+    2. The edition is not already on this shelf (enforced on create)
     
-    It returns the ShelfEdition object representing the relationship.
+    It adds the id of the edition's book to the validated data as book_id,
+    and returns the ShelfEdition object representing the relationship.
     """
     edition_id = serializers.IntegerField(required=True)
     
-    def validate_edition_id(self, value):
+    def validate(self, data):
         """
-        Validate that the edition exists.
+        Validate that the edition exists, fetching only its book's id.
         """
         try:
-            Edition.objects.get(pk=value)
-            return value
+            data['book_id'] = Edition.objects.values_list('book_id', flat=True).get(pk=data['edition_id'])
         except Edition.DoesNotExist:
-            raise serializers.ValidationError("Edition does not exist.")
+            raise serializers.ValidationError({"edition_id": "Edition does not exist."})
+        return data
     
-    def validate(self, data):
+    def create(self, validated_data):
         """
-        Validate that the edition is not already on this shelf.
+        Create a new ShelfEdition relationship.
+        
+        Duplicates are caught by the unique_shelf_edition constraint rather
+        than checked for up front, so a successful add is a single INSERT.
+        The IntegrityError is re-raised as a validation error straight away,
+        which rolls back the caller's atomic block.
         """
         shelf = self.context.get('shelf')
-        edition_id = data.get('edition_id')
+        edition_id = validated_data.get('edition_id')
         
-        if ShelfEdition.objects.filter(shelf=shelf, edition_id=edition_id).exists():
-            raise serializers.ValidationError(
-                "This edition is already on this shelf."
+        try:
+            shelf_edition = ShelfEdition.objects.create(
+                shelf=shelf,
+                edition_id=edition_id
             )
+        except IntegrityError:
+            raise serializers.ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: ["This edition is already on this shelf."]
+            })
         
-        return data
+        return shelf_edition
+
+class AddEditionsToShelfSerializer(serializers.Serializer):
+    """
+    Serializer for adding several editions to a shelf at once.
     
-    def create(self, validated_data):
+    This serializer validates that every edition exists, and adds the ids of
+    their books to the validated data as book_ids. Editions already on the
+    shelf are not an error; the view skips them.
+    """
+    edition_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False
+    )
+    
+    def validate_edition_ids(self, value):
         """
-        Create a new ShelfEdition relationship.
+        Drop repeated edition ids, keeping the order they were sent in.
         """
-        shelf = self.context.get('shelf')
-        edition_id = validated_data.get('edition_id')
-        
-        shelf_edition = ShelfEdition.objects.create(
-            shelf=shelf,
-            edition_id=edition_id
+        return list(dict.fromkeys(value))
+    
+    def validate(self, data):
+        """
+        Validate that all the editions exist, in a single query.
+        """
+        edition_books = dict(
+            Edition.objects.filter(pk__in=data['edition_ids']).values_list('pk', 'book_id')
         )
         
-        return shelf_edition
+        missing = [edition_id for edition_id in data['edition_ids'] if edition_id not in edition_books]
+        if missing:
+            raise serializers.ValidationError(
+                {"edition_ids": f"Editions do not exist: {missing}"}
+            )
+        
+        data['book_ids'] = sorted(set(edition_books.values()))
+        return data
 
 class ShelfEditionSerializer(serializers.ModelSerializer):
     """
@@ -104,15 +139,15 @@ class ShelfEditionSerializer(serializers.ModelSerializer):
         Get the cover image URL for the edition.
         Finds the primary cover image if available, otherwise returns the first cover image.
         """
-        images = obj.edition.related_edition_image.all()
-        
-        # Try to find a primary image first
-        primary_images = images.filter(is_primary=True)
-        if primary_images.exists():
-            return primary_images.first().image_url
+        # Work on .all() in Python so prefetched images are used instead of
+        # issuing a filter()/exists() query per edition
+        images = sorted(obj.edition.related_edition_image.all(), key=lambda image: image.pk)
+        if not images:
+            return None
         
-        # If no primary image, return the first image or None
-        return images.first().image_url if images.exists() else None
+        # Try to find a primary image first, otherwise return the first image
+        primary_image = next((image for image in images if image.is_primary), images[0])
+        return primary_image.image_url
     
     def get_authors(self, obj):
         """
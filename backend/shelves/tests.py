@@ -1,12 +1,23 @@
-from django.test import TestCase
+import json
+from contextlib import nullcontext
+
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
 from django.contrib.auth import get_user_model
-from library.models import Shelf, ShelfEdition, Edition, Book, Publisher, UserBook
+from django.db import transaction
+from library.models import (
+    Shelf, ShelfEdition, Edition, Book, Publisher, UserBook, Author, BookAuthor, CoverImage
+)
 from rest_framework.test import APIClient
 from django.urls import reverse
+from django.utils.http import urlencode
 from rest_framework import status
 
 User = get_user_model()
 
+# Hashing "testpassword" with the default PBKDF2 hasher dominates user creation
+# in these tests; a single-round MD5 hash is plenty for test fixtures.
+FAST_PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
 
 ### Equivalent Classes ###
 ##  Authentication Status ##
@@ -40,22 +51,28 @@ User = get_user_model()
 #       duplicate shelf name among user (invalid)
 #       duplicate shelf name among different users (valid)
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class ShelfCreateTests(TestCase):
     """
     Test Module for creating shelves based on listed equivalence classes
     """
-    def setUp(self):
+    # Have the test runner build an APIClient for each test directly rather
+    # than a Django Client that setUp immediately replaced
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
         """
-        Create test (mock) data for class.
-        Test users, existing shelf (check for duplicates), API client, and url.
+        Create test (mock) data once for the class.
+        Test users, existing shelf (check for duplicates), and url.
         """  
         # Create test users
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username = "testuser_1",
             email = "test@example.com",
             password = "testpassword"
         )      
-        self.user_other = User.objects.create_user(
+        cls.user_other = User.objects.create_user(
             username = "testuser_2",
             email = "other@example.com",
             password = "testpassword"
@@ -63,18 +80,15 @@ class ShelfCreateTests(TestCase):
 
         # Create existing shelf to check for duplicate testing
         Shelf.objects.create(
-            user = self.user,
+            user = cls.user,
             name = "Existing Shelf",
             shelf_type = "Custom",
             is_private = False
         )
 
-        # Set up API client
-        self.client = APIClient()
-
         # Set up URL for shelf creation (independent from urls.py)
-        self.url = reverse("shelf-list")
-    
+        cls.url = reverse("shelf-list")
+
     ### Actaul tests ###
 
     ## Authentication Status
@@ -170,10 +184,9 @@ class ShelfCreateTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data['name'], name)
         
-        # Verify all three shelves were created
-        self.assertTrue(Shelf.objects.filter(user=self.user, name="A").exists())
-        self.assertTrue(Shelf.objects.filter(user=self.user, name="A" * 250).exists())
-        self.assertTrue(Shelf.objects.filter(user=self.user, name="A" * 125).exists())
+        # Verify all three shelves were created, in a single query
+        names = ["A", "A" * 250, "A" * 125]
+        self.assertEqual(Shelf.objects.filter(user=self.user, name__in=names).count(), 3)
 
     # Name length: x < 1 (invalid)
     def test_create_shelf_empty_name(self):
@@ -488,19 +501,13 @@ class ShelfCreateTests(TestCase):
         response2 = self.client.post(self.url, data, format='json')
         self.assertEqual(response2.status_code, status.HTTP_201_CREATED)
         
-        # Verify both users have shelves with the same name
-        self.assertTrue(
-            Shelf.objects.filter(
-                user=self.user,
-                name='Common Shelf Name'
-            ).exists()
-        )
-        
-        self.assertTrue(
+        # Verify both users have shelves with the same name, in a single query
+        self.assertEqual(
             Shelf.objects.filter(
-                user=self.user_other,
+                user__in=[self.user, self.user_other],
                 name='Common Shelf Name'
-            ).exists()
+            ).count(),
+            2
         )
 
 ### Equivalent Classes ###
@@ -521,27 +528,31 @@ class ShelfCreateTests(TestCase):
 ##  Empty results ##
 #       User with no shelves                    (valid - returns empty list)
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class ShelfListTests(TestCase):
     """
     Test Module for listing shelves based on listed equivalence classes
     """
-    def setUp(self):
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
         """
-        Create test (mock) data for class.
+        Create test (mock) data once for the class.
         Test users and shelves with different privacy settings.
         """  
         # Create test users
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username = "testuser_1",
             email = "test@example.com",
             password = "testpassword"
         )      
-        self.user_other = User.objects.create_user(
+        cls.user_other = User.objects.create_user(
             username = "testuser_2",
             email = "other@example.com",
             password = "testpassword"
         )
-        self.user_empty = User.objects.create_user(
+        cls.user_empty = User.objects.create_user(
             username = "emptyuser",
             email = "empty@example.com",
             password = "testpassword"
@@ -550,13 +561,13 @@ class ShelfListTests(TestCase):
         # Create various shelves for testing
         # For primary user - public shelves
         Shelf.objects.create(
-            user = self.user,
+            user = cls.user,
             name = "Public Shelf 1",
             shelf_type = "Custom",
             is_private = False
         )
         Shelf.objects.create(
-            user = self.user,
+            user = cls.user,
             name = "Public Shelf 2",
             shelf_type = "Read",
             is_private = False
@@ -564,13 +575,13 @@ class ShelfListTests(TestCase):
 
         # For primary user - private shelves
         Shelf.objects.create(
-            user = self.user,
+            user = cls.user,
             name = "Private Shelf 1",
             shelf_type = "Custom",
             is_private = True
         )
         Shelf.objects.create(
-            user = self.user,
+            user = cls.user,
             name = "Private Shelf 2",
             shelf_type = "Want to Read",
             is_private = True
@@ -578,7 +589,7 @@ class ShelfListTests(TestCase):
 
         # For other user - public shelf
         Shelf.objects.create(
-            user = self.user_other,
+            user = cls.user_other,
             name = "Other User Public Shelf",
             shelf_type = "Owned",
             is_private = False
@@ -586,18 +597,15 @@ class ShelfListTests(TestCase):
 
         # For other user - private shelf
         Shelf.objects.create(
-            user = self.user_other,
+            user = cls.user_other,
             name = "Other User Private Shelf",
             shelf_type = "Lent Out",
             is_private = True
         )
 
-        # Set up API client
-        self.client = APIClient()
-
         # Set up URL for shelf listing
-        self.url = reverse("shelf-list")
-    
+        cls.url = reverse("shelf-list")
+
     ### Actual tests ###
 
     ## Authentication Status
@@ -617,15 +625,6 @@ class ShelfListTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 4)  # All 4 shelves from this user
 
-    # Authentication Status: Unauthenticated user (invalid)
-    def test_list_shelves_user_unauthenticated(self):
-        """Test listing shelves when user is unauthenticated"""
-        # Get response without authentication
-        response = self.client.get(self.url)
-        
-        # Make sure request fails with unauthorized
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-
     ## User filtering
 
     # Own user (valid - sees all shelves)
@@ -719,6 +718,32 @@ class ShelfListTests(TestCase):
         shelf_names = [shelf['name'] for shelf in response.data]
         self.assertNotIn('Other User Private Shelf', shelf_names)
 
+    # Renamed user (valid - the username is looked up on each request)
+    def test_list_other_user_shelves_after_rename(self):
+        """Test that a renamed user's shelves are found under the new username only"""
+        self.client.force_authenticate(user=self.user)
+        
+        # Look the user up once, then rename them
+        self.client.get(f"{self.url}?username=testuser_2")
+        self.user_other.username = "renameduser"
+        self.user_other.save()
+        
+        # The new username resolves, and the old one no longer does
+        response = self.client.get(f"{self.url}?username=renameduser")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('Other User Public Shelf', [shelf['name'] for shelf in response.data])
+        response = self.client.get(f"{self.url}?username=testuser_2")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        
+        # Once someone else takes the freed username, it resolves to them
+        new_owner = User.objects.create_user(username="testuser_2", email="newowner@example.com")
+        Shelf.objects.create(user=new_owner, name="New Owner Public Shelf", is_private=False)
+        response = self.client.get(f"{self.url}?username=testuser_2")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        names = [shelf['name'] for shelf in response.data]
+        self.assertIn('New Owner Public Shelf', names)
+        self.assertNotIn('Other User Public Shelf', names)
+
     ## Shelf type filtering
 
     # Filter by valid shelf_type (valid)
@@ -762,6 +787,63 @@ class ShelfListTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 0)  # No shelves
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class ShelfDetailBaseTest(TestCase):
+    """
+    Base test class with the users shared by the shelf detail
+    (delete, retrieve and update) tests
+    """
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Create the shelf owner and another user once per class.
+        """
+        cls.user = User.objects.create_user(
+            username="shelf_tester",
+            email="shelf_tester@example.com",
+            password="testpassword"
+        )
+        cls.other_user = User.objects.create_user(
+            username="other_user",
+            email="other_user@example.com",
+            password="testpassword"
+        )
+
+    def _assert_crud(self, method, url, user, expected_status, data=None, persists=None, num_queries=None):
+        """
+        Send a `method` request to `url` and assert the response status.
+
+        Args:
+            method: Client method name ("get", "patch", "delete")
+            url: Target URL
+            user: User to authenticate as, or None to stay unauthenticated
+            expected_status: Expected response status code
+            data: Optional request body, sent as JSON
+            persists: Optional (instance, expected) pair; asserts whether the
+                instance's row still exists after the request
+            num_queries: Optional query count to pin the request to
+
+        Returns the response for any further assertions.
+        """
+        if user is not None:
+            self.client.force_authenticate(user=user)
+
+        send = getattr(self.client, method)
+        kwargs = {"format": "json"} if data is not None else {}
+        with self.assertNumQueries(num_queries) if num_queries is not None else nullcontext():
+            response = send(url, data, **kwargs)
+
+        self.assertEqual(response.status_code, expected_status)
+
+        if persists is not None:
+            instance, expected = persists
+            exists = type(instance).objects.filter(pk=instance.pk).exists()
+            self.assertEqual(exists, expected)
+
+        return response
+
 ### Equivalent Classes ###
 ##  Authentication Status ##
 #       Authenticated user                  (valid)
@@ -773,58 +855,46 @@ class ShelfListTests(TestCase):
 #       User tries delete shlef that DNE    (invalid)
 ##  Accessing Deleted Shelf ##
 #       Cannot access a deleted shelf       (valid)
-class ShelfDeleteTests(TestCase):
+class ShelfDeleteTests(ShelfDetailBaseTest):
     """
     Test Module for deleting shelves based on listed equivalence classes
     """
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Create test users, shelves, and API client for use in delete tests.
+        Create shelves and URLs once for all delete tests.
         """
-        # Create users
-        self.user = User.objects.create_user(
-            username="delete_tester",
-            email="delete_tester@example.com",
-            password="testpassword"
-        )
-        self.other_user = User.objects.create_user(
-            username="other_user",
-            email="other_user@example.com",
-            password="testpassword"
-        )
+        super().setUpTestData()
         
-        # Create shelves: one owned by self.user, one by other_user
-        self.own_shelf = Shelf.objects.create(
-            user=self.user,
+        # Create shelves: one owned by user, one by other_user
+        cls.own_shelf = Shelf.objects.create(
+            user=cls.user,
             name="User's Shelf",
             shelf_type="Custom",
             is_private=False
         )
-        self.other_shelf = Shelf.objects.create(
-            user=self.other_user,
+        cls.other_shelf = Shelf.objects.create(
+            user=cls.other_user,
             name="Other User's Shelf",
             shelf_type="Custom",
             is_private=False
         )
 
-        # Create a non-custom shelf owned by self.user
-        self.non_custom_shelf = Shelf.objects.create(
-            user=self.user,
+        # Create a non-custom shelf owned by user
+        cls.non_custom_shelf = Shelf.objects.create(
+            user=cls.user,
             name="Non-custom Shelf",
             shelf_type="Read",
             is_private=False
         )
 
         # URL for the non-custom shelf
-        self.non_custom_shelf_url = reverse("shelf-detail", kwargs={"pk": self.non_custom_shelf.pk})
-        
-        # API client
-        self.client = APIClient()
+        cls.non_custom_shelf_url = reverse("shelf-detail", kwargs={"pk": cls.non_custom_shelf.pk})
         
         # Detail URLs
-        self.own_shelf_url = reverse("shelf-detail", kwargs={"pk": self.own_shelf.pk})
-        self.other_shelf_url = reverse("shelf-detail", kwargs={"pk": self.other_shelf.pk})
-        self.non_existent_shelf_url = reverse("shelf-detail", kwargs={"pk": 999999})
+        cls.own_shelf_url = reverse("shelf-detail", kwargs={"pk": cls.own_shelf.pk})
+        cls.other_shelf_url = reverse("shelf-detail", kwargs={"pk": cls.other_shelf.pk})
+        cls.non_existent_shelf_url = reverse("shelf-detail", kwargs={"pk": 999999})
 
     ##  Authentication Status
 
@@ -833,31 +903,11 @@ class ShelfDeleteTests(TestCase):
         """
         Test that an authenticated user can delete their own shelf (valid).
         """
-        # Authenticate as the shelf owner
-        self.client.force_authenticate(user=self.user)
-        
-        # Send DELETE request
-        response = self.client.delete(self.own_shelf_url)
-        
-        # Assert successful deletion (204 No Content)
-        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
-        
-        # Verify that the shelf no longer exists
-        self.assertFalse(Shelf.objects.filter(pk=self.own_shelf.pk).exists())
-
-    # Unauthenticated user (invalid)
-    def test_delete_shelf_unauthenticated_user(self):
-        """
-        Test that an unauthenticated user cannot delete any shelf (invalid).
-        """
-        # Do not authenticate
-        response = self.client.delete(self.own_shelf_url)
-        
-        # Assert that deletion is not allowed (401 Unauthorized)
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-        
-        # Verify the shelf still exists
-        self.assertTrue(Shelf.objects.filter(pk=self.own_shelf.pk).exists())
+        # Pin the query count to catch N+1 regressions
+        self._assert_crud(
+            "delete", self.own_shelf_url, self.user, status.HTTP_204_NO_CONTENT,
+            persists=(self.own_shelf, False), num_queries=5
+        )
 
     ##  Deletion
 
@@ -866,41 +916,27 @@ class ShelfDeleteTests(TestCase):
         """
         Test that a user cannot delete another user's shelf (invalid).
         """
-        # Authenticate as self.user, but attempt to delete other_user's shelf
-        self.client.force_authenticate(user=self.user)
-
-        # Attempt DELETE
-        response = self.client.delete(self.other_shelf_url)
-
-        # Expect 404
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-
-        # Verify the shelf still exists
-        self.assertTrue(Shelf.objects.filter(pk=self.other_shelf.pk).exists())
+        self._assert_crud(
+            "delete", self.other_shelf_url, self.user, status.HTTP_403_FORBIDDEN,
+            persists=(self.other_shelf, True)
+        )
 
     # User tries to delete non-existent shelf (invalid)
     def test_delete_nonexistent_shelf(self):
         """
         Test that deleting a non-existent shelf returns 404 (invalid).
         """
-        # Authenticate as the shelf owner
-        self.client.force_authenticate(user=self.user)
-        
-        # Attempt DELETE for a shelf that doesn't exist
-        response = self.client.delete(self.non_existent_shelf_url)
-        
-        # Assert that result is not found (404)
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self._assert_crud("delete", self.non_existent_shelf_url, self.user, status.HTTP_404_NOT_FOUND)
     
     # User deletes non-custom shelf (invalid)
     def test_delete_non_custom_shelf_invalid(self):
         """
         Test that a user cannot delete their own non-custom shelf (invalid).
         """
-        self.client.force_authenticate(user=self.user)
-        response = self.client.delete(self.non_custom_shelf_url)
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-        self.assertTrue(Shelf.objects.filter(pk=self.non_custom_shelf.pk).exists())
+        self._assert_crud(
+            "delete", self.non_custom_shelf_url, self.user, status.HTTP_403_FORBIDDEN,
+            persists=(self.non_custom_shelf, True), num_queries=1
+        )
 
     ##  Accessing Deleted Shelf
 
@@ -909,16 +945,8 @@ class ShelfDeleteTests(TestCase):
         """
         Test that once a shelf is deleted, it cannot be accessed (404 Not Found).
         """
-        # Authenticate as the shelf owner and delete the shelf
-        self.client.force_authenticate(user=self.user)
-        delete_response = self.client.delete(self.own_shelf_url)
-        self.assertEqual(delete_response.status_code, status.HTTP_204_NO_CONTENT)
-        
-        # Try to retrieve the same shelf
-        get_response = self.client.get(self.own_shelf_url)
-        
-        # Expect 404 Not Found
-        self.assertEqual(get_response.status_code, status.HTTP_404_NOT_FOUND)
+        self._assert_crud("delete", self.own_shelf_url, self.user, status.HTTP_204_NO_CONTENT)
+        self._assert_crud("get", self.own_shelf_url, self.user, status.HTTP_404_NOT_FOUND)
 
 ### Equivalence Classes ###
 ##  Authentication Status ##
@@ -931,62 +959,50 @@ class ShelfDeleteTests(TestCase):
 #       Retrieve other user's private shelf                 (invalid)
 ##  Non-existent Shelf ##
 #       Retrieve nonexistent shelf                          (invalid)
-class ShelfRetrieveTests(TestCase):
+class ShelfRetrieveTests(ShelfDetailBaseTest):
     """
     Test Module for retrieving shelves based on listed equivalence classes
     """
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Create test users, shelves, and API client for retrieval tests.
+        Create shelves and URLs once for all retrieval tests.
         """
-        # Create users
-        self.user = User.objects.create_user(
-            username="retriever",
-            email="retriever@example.com",
-            password="testpassword"
-        )
-        self.other_user = User.objects.create_user(
-            username="other_user",
-            email="other_user@example.com",
-            password="testpassword"
-        )
+        super().setUpTestData()
 
         # Create shelves: own public, own private, other user public, other user private
-        self.own_public = Shelf.objects.create(
-            user=self.user,
+        cls.own_public = Shelf.objects.create(
+            user=cls.user,
             name="My Public Shelf",
             shelf_type="Custom",
             is_private=False
         )
-        self.own_private = Shelf.objects.create(
-            user=self.user,
+        cls.own_private = Shelf.objects.create(
+            user=cls.user,
             name="My Private Shelf",
             shelf_type="Custom",
             is_private=True
         )
-        self.other_public = Shelf.objects.create(
-            user=self.other_user,
+        cls.other_public = Shelf.objects.create(
+            user=cls.other_user,
             name="Other Public Shelf",
             shelf_type="Custom",
             is_private=False
         )
-        self.other_private = Shelf.objects.create(
-            user=self.other_user,
+        cls.other_private = Shelf.objects.create(
+            user=cls.other_user,
             name="Other Private Shelf",
             shelf_type="Custom",
             is_private=True
         )
 
-        # API client
-        self.client = APIClient()
-
         # Detail URLs for each shelf
-        self.own_public_url = reverse("shelf-detail", kwargs={"pk": self.own_public.pk})
-        self.own_private_url = reverse("shelf-detail", kwargs={"pk": self.own_private.pk})
-        self.other_public_url = reverse("shelf-detail", kwargs={"pk": self.other_public.pk})
-        self.other_private_url = reverse("shelf-detail", kwargs={"pk": self.other_private.pk})
+        cls.own_public_url = reverse("shelf-detail", kwargs={"pk": cls.own_public.pk})
+        cls.own_private_url = reverse("shelf-detail", kwargs={"pk": cls.own_private.pk})
+        cls.other_public_url = reverse("shelf-detail", kwargs={"pk": cls.other_public.pk})
+        cls.other_private_url = reverse("shelf-detail", kwargs={"pk": cls.other_private.pk})
         # Nonexistent shelf URL
-        self.nonexistent_url = reverse("shelf-detail", kwargs={"pk": 9999999})
+        cls.nonexistent_url = reverse("shelf-detail", kwargs={"pk": 9999999})
 
     ## Authenticated user retrieving own shelves
 
@@ -994,28 +1010,17 @@ class ShelfRetrieveTests(TestCase):
         """
         Test retrieving own public shelf (valid for authenticated user).
         """
-        # Authenticate
-        self.client.force_authenticate(user=self.user)
-
-        # GET request
-        response = self.client.get(self.own_public_url)
-
-        # Expect success (200), and correct shelf name
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Pin the query count to catch N+1 regressions
+        response = self._assert_crud(
+            "get", self.own_public_url, self.user, status.HTTP_200_OK, num_queries=1
+        )
         self.assertEqual(response.data['name'], "My Public Shelf")
 
     def test_retrieve_own_private_shelf(self):
         """
         Test retrieving own private shelf (valid for authenticated user).
         """
-        # Authenticate
-        self.client.force_authenticate(user=self.user)
-
-        # GET request
-        response = self.client.get(self.own_private_url)
-
-        # Expect success (200), and correct shelf name
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self._assert_crud("get", self.own_private_url, self.user, status.HTTP_200_OK)
         self.assertEqual(response.data['name'], "My Private Shelf")
 
     ## Authenticated user retrieving other user's shelves
@@ -1024,14 +1029,7 @@ class ShelfRetrieveTests(TestCase):
         """
         Test retrieving another user's public shelf (valid).
         """
-        # Authenticate
-        self.client.force_authenticate(user=self.user)
-
-        # GET request
-        response = self.client.get(self.other_public_url)
-
-        # Expect 200 success
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self._assert_crud("get", self.other_public_url, self.user, status.HTTP_200_OK)
         self.assertEqual(response.data['name'], "Other Public Shelf")
 
     def test_retrieve_other_user_private_shelf(self):
@@ -1039,14 +1037,7 @@ class ShelfRetrieveTests(TestCase):
         Test retrieving another user's private shelf (invalid).
         Should cause 403 Forbidden error.
         """
-        # Authenticate
-        self.client.force_authenticate(user=self.user)
-
-        # GET request
-        response = self.client.get(self.other_private_url)
-
-        # Expect failure (403)
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self._assert_crud("get", self.other_private_url, self.user, status.HTTP_403_FORBIDDEN)
 
     ## Non-existent Shelf
 
@@ -1054,25 +1045,7 @@ class ShelfRetrieveTests(TestCase):
         """
         Test retrieving a shelf that does not exist (always invalid, 404).
         """
-        # Authenticate
-        self.client.force_authenticate(user=self.user)
-
-        # GET request
-        response = self.client.get(self.nonexistent_url)
-
-        # Expect 404
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-
-    ## Unauthenticated user
-
-    def test_retrieve_shelf_unauthenticated(self):
-        """
-        Test retrieving any shelf while unauthenticated (invalid).
-        """
-        response = self.client.get(self.own_public_url)
-
-        # Expect 401 Unauthorized
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self._assert_crud("get", self.nonexistent_url, self.user, status.HTTP_404_NOT_FOUND)
 
 
 ### Equivalent Classes ###
@@ -1093,71 +1066,48 @@ class ShelfRetrieveTests(TestCase):
 ##  Non-existent Shelf ##
 #       Updating non-existent shelf    (invalid)
 
-class ShelfUpdateTests(TestCase):
+class ShelfUpdateTests(ShelfDetailBaseTest):
     """
     Test Module for updating shelves based on listed equivalance partitions
     """
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Create test users, shelves, and API client for update tests.
+        Create shelves and URLs once for all update tests.
         """
-        # Create users
-        self.user = User.objects.create_user(
-            username="update_user",
-            email="update@example.com",
-            password="testpassword"
-        )
-        self.other_user = User.objects.create_user(
-            username="other_user",
-            email="other@example.com",
-            password="testpassword"
-        )
+        super().setUpTestData()
 
         # Create shelves for testing
-        self.custom_owned_shelf = Shelf.objects.create(
-            user=self.user,
+        cls.custom_owned_shelf = Shelf.objects.create(
+            user=cls.user,
             name="Custom Owned Shelf",
             shelf_type="Custom",
             is_private=False,
             shelf_desc="Owned custom shelf"
         )
-        self.non_custom_owned_shelf = Shelf.objects.create(
-            user=self.user,
+        cls.non_custom_owned_shelf = Shelf.objects.create(
+            user=cls.user,
             name="Non-Custom Shelf",
             shelf_type="Read",
             is_private=False,
             shelf_desc="Owned non-custom shelf"
         )
-        self.custom_other_shelf = Shelf.objects.create(
-            user=self.other_user,
+        cls.custom_other_shelf = Shelf.objects.create(
+            user=cls.other_user,
             name="Other User Custom Shelf",
             shelf_type="Custom",
             is_private=False,
-            shelf_desc="Not owned by update_user"
+            shelf_desc="Not owned by shelf_tester"
         )
 
-        # API client
-        self.client = APIClient()
-
         # Detail URLs
-        self.custom_owned_url = reverse("shelf-detail", kwargs={"pk": self.custom_owned_shelf.pk})
-        self.non_custom_owned_url = reverse("shelf-detail", kwargs={"pk": self.non_custom_owned_shelf.pk})
-        self.custom_other_url = reverse("shelf-detail", kwargs={"pk": self.custom_other_shelf.pk})
-        self.non_existent_url = reverse("shelf-detail", kwargs={"pk": 9999999})
+        cls.custom_owned_url = reverse("shelf-detail", kwargs={"pk": cls.custom_owned_shelf.pk})
+        cls.non_custom_owned_url = reverse("shelf-detail", kwargs={"pk": cls.non_custom_owned_shelf.pk})
+        cls.custom_other_url = reverse("shelf-detail", kwargs={"pk": cls.custom_other_shelf.pk})
+        cls.non_existent_url = reverse("shelf-detail", kwargs={"pk": 9999999})
 
     ### Actual tests ###
 
-    ## Authentication Status
-
-    # Authenticated user (valid only if owned & custom)
-    def test_update_shelf_unauthenticated(self):
-        """
-        Updating a shelf when user is unauthenticated (invalid).
-        """
-        data = {'name': 'New Name'}
-        response = self.client.patch(self.custom_owned_url, data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-
     ## Shelf Ownership + Type
 
     # Owned & Custom (valid)
@@ -1165,11 +1115,13 @@ class ShelfUpdateTests(TestCase):
         """
         Updating own custom shelf (valid).
         """
-        self.client.force_authenticate(user=self.user)
         data = {'name': 'Updated Custom Shelf Name', 'shelf_desc': 'Updated desc'}
-        response = self.client.patch(self.custom_owned_url, data, format='json')
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Pin the query count to catch N+1 regressions
+        response = self._assert_crud(
+            "patch", self.custom_owned_url, self.user, status.HTTP_200_OK,
+            data=data, num_queries=2
+        )
         self.assertEqual(response.data['name'], 'Updated Custom Shelf Name')
         self.assertEqual(response.data['shelf_desc'], 'Updated desc')
 
@@ -1178,22 +1130,20 @@ class ShelfUpdateTests(TestCase):
         """
         Updating own non-custom shelf (invalid).
         """
-        self.client.force_authenticate(user=self.user)
-        data = {'name': 'New Name for Non-Custom'}
-        response = self.client.patch(self.non_custom_owned_url, data, format='json')
-
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self._assert_crud(
+            "patch", self.non_custom_owned_url, self.user, status.HTTP_403_FORBIDDEN,
+            data={'name': 'New Name for Non-Custom'}, num_queries=1
+        )
 
     # Not owned (invalid)
     def test_update_other_users_custom_shelf_invalid(self):
         """
         Updating another user's custom shelf (invalid).
         """
-        self.client.force_authenticate(user=self.user)
-        data = {'name': 'Hacking Attempt'}
-        response = self.client.patch(self.custom_other_url, data, format='json')
-
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self._assert_crud(
+            "patch", self.custom_other_url, self.user, status.HTTP_403_FORBIDDEN,
+            data={'name': 'Hacking Attempt'}
+        )
 
     ## Update Fields
 
@@ -1202,11 +1152,10 @@ class ShelfUpdateTests(TestCase):
         """
         Updating name within valid length (valid).
         """
-        self.client.force_authenticate(user=self.user)
-        data = {'name': 'Valid Name'}
-        response = self.client.patch(self.custom_owned_url, data, format='json')
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self._assert_crud(
+            "patch", self.custom_owned_url, self.user, status.HTTP_200_OK,
+            data={'name': 'Valid Name'}
+        )
         self.assertEqual(response.data['name'], 'Valid Name')
 
     # Invalid name length
@@ -1214,22 +1163,20 @@ class ShelfUpdateTests(TestCase):
         """
         Updating name exceeding max length (invalid).
         """
-        self.client.force_authenticate(user=self.user)
-        data = {'name': 'A' * 251}
-        response = self.client.patch(self.custom_owned_url, data, format='json')
-
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self._assert_crud(
+            "patch", self.custom_owned_url, self.user, status.HTTP_400_BAD_REQUEST,
+            data={'name': 'A' * 251}
+        )
 
     # Updating shelf_desc
     def test_update_owned_custom_shelf_desc_valid(self):
         """
         Updating shelf_desc on own custom shelf (valid).
         """
-        self.client.force_authenticate(user=self.user)
-        data = {'shelf_desc': 'New description'}
-        response = self.client.patch(self.custom_owned_url, data, format='json')
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self._assert_crud(
+            "patch", self.custom_owned_url, self.user, status.HTTP_200_OK,
+            data={'shelf_desc': 'New description'}
+        )
         self.assertEqual(response.data['shelf_desc'], 'New description')
 
     # Updating is_private
@@ -1237,11 +1184,10 @@ class ShelfUpdateTests(TestCase):
         """
         Updating is_private on own custom shelf (valid).
         """
-        self.client.force_authenticate(user=self.user)
-        data = {'is_private': True}
-        response = self.client.patch(self.custom_owned_url, data, format='json')
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self._assert_crud(
+            "patch", self.custom_owned_url, self.user, status.HTTP_200_OK,
+            data={'is_private': True}
+        )
         self.assertTrue(response.data['is_private'])
 
     # Updating shelf_img
@@ -1249,11 +1195,10 @@ class ShelfUpdateTests(TestCase):
         """
         Updating shelf_img on own custom shelf (valid).
         """
-        self.client.force_authenticate(user=self.user)
         data = {'shelf_img': 'https://ia800100.us.archive.org/view_archive.php?archive=/5/items/l_covers_0012/l_covers_0012_64.zip&file=0012646659-L.jpg'}
-        response = self.client.patch(self.custom_owned_url, data, format='json')
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self._assert_crud(
+            "patch", self.custom_owned_url, self.user, status.HTTP_200_OK, data=data
+        )
         self.assertEqual(response.data['shelf_img'], 'https://ia800100.us.archive.org/view_archive.php?archive=/5/items/l_covers_0012/l_covers_0012_64.zip&file=0012646659-L.jpg')
 
     # Attempting to change shelf_type
@@ -1261,11 +1206,10 @@ class ShelfUpdateTests(TestCase):
         """
         Attempting to change shelf_type from 'Custom' (invalid).
         """
-        self.client.force_authenticate(user=self.user)
-        data = {'shelf_type': 'Read'}
-        response = self.client.patch(self.custom_owned_url, data, format='json')
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self._assert_crud(
+            "patch", self.custom_owned_url, self.user, status.HTTP_200_OK,
+            data={'shelf_type': 'Read'}
+        )
         # After the update, it should still remain 'Custom' if code ignores or reverts changes
         self.assertEqual(response.data['shelf_type'], 'Custom')
 
@@ -1276,123 +1220,113 @@ class ShelfUpdateTests(TestCase):
         """
         Updating a shelf that does not exist (invalid).
         """
-        self.client.force_authenticate(user=self.user)
-        data = {'name': 'Does Not Matter'}
-        response = self.client.patch(self.non_existent_url, data, format='json')
-
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self._assert_crud(
+            "patch", self.non_existent_url, self.user, status.HTTP_404_NOT_FOUND,
+            data={'name': 'Does Not Matter'}
+        )
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class ShelfEditionBaseTest(TestCase):
     """
     Base test class with common setup for shelf-edition operations
     """
-    def setUp(self):
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
         """
-        Create common test data needed for all shelf-edition tests
+        Create common test data needed for all shelf-edition tests once per class
         """
         # Create test users
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username="shelf_owner",
             email="owner@example.com",
             password="testpassword"
         )
-        self.other_user = User.objects.create_user(
+        cls.other_user = User.objects.create_user(
             username="other_user",
             email="other@example.com",
             password="testpassword"
         )
         
         # Create basic book (required for Edition FK)
-        self.book = Book.objects.create(title="Test Book")
+        cls.book = Book.objects.create(title="Test Book")
         
         # Create basic publisher (required for Edition FK)
-        self.publisher = Publisher.objects.create(name="Test Publisher")
+        cls.publisher = Publisher.objects.create(name="Test Publisher")
         
         # Create test editions
-        self.edition1 = Edition.objects.create(
-            book=self.book,
+        cls.edition1 = Edition.objects.create(
+            book=cls.book,
             isbn="9798989445622",
-            publisher=self.publisher,
+            publisher=cls.publisher,
             kind="Hardcover",
             publication_year=2020,
             language="English"
         )
         
-        self.edition2 = Edition.objects.create(
-            book=self.book,
+        cls.edition2 = Edition.objects.create(
+            book=cls.book,
             isbn="9780486852966",
-            publisher=self.publisher,
+            publisher=cls.publisher,
             kind="Paperback",
             publication_year=2021,
             language="English"
         )
         
-        self.edition3 = Edition.objects.create(
-            book=self.book,
+        cls.edition3 = Edition.objects.create(
+            book=cls.book,
             isbn="9780593438367",
-            publisher=self.publisher,
+            publisher=cls.publisher,
             kind="eBook",
             publication_year=2022,
             language="English"
         )
         
         # Create test shelves
-        self.shelf = Shelf.objects.create(
-            user=self.user,
+        cls.shelf = Shelf.objects.create(
+            user=cls.user,
             name="Test Shelf",
             shelf_type="Custom",
             is_private=False
         )
         
-        self.private_shelf = Shelf.objects.create(
-            user=self.user,
+        cls.private_shelf = Shelf.objects.create(
+            user=cls.user,
             name="Private Shelf",
             shelf_type="Custom",
             is_private=True
         )
         
-        self.other_user_shelf = Shelf.objects.create(
-            user=self.other_user,
+        cls.other_user_shelf = Shelf.objects.create(
+            user=cls.other_user,
             name="Other User's Shelf",
             shelf_type="Custom",
             is_private=False
         )
         
-        self.other_private_shelf = Shelf.objects.create(
-            user=self.other_user,
+        cls.other_private_shelf = Shelf.objects.create(
+            user=cls.other_user,
             name="Other User's Private Shelf",
             shelf_type="Custom",
             is_private=True
         )
         
-        # Add one edition to shelf to test duplicate validation
-        ShelfEdition.objects.create(
-            shelf=self.shelf,
-            edition=self.edition3
-        )
-        
-        # Add one edition to private shelf
-        ShelfEdition.objects.create(
-            shelf=self.private_shelf,
-            edition=self.edition2
-        )
-        
-        # Add one edition to other user's shelf
-        ShelfEdition.objects.create(
-            shelf=self.other_user_shelf,
-            edition=self.edition1
-        )
+        # Place one edition on each of: shelf (to test duplicate validation),
+        # private shelf and other user's shelf, in a single INSERT
+        ShelfEdition.objects.bulk_create([
+            ShelfEdition(shelf=cls.shelf, edition=cls.edition3),
+            ShelfEdition(shelf=cls.private_shelf, edition=cls.edition2),
+            ShelfEdition(shelf=cls.other_user_shelf, edition=cls.edition1),
+        ])
         
         # Create empty shelf for testing
-        self.empty_shelf = Shelf.objects.create(
-            user=self.user,
+        cls.empty_shelf = Shelf.objects.create(
+            user=cls.user,
             name="Empty Shelf",
             shelf_type="Custom",
             is_private=False
         )
-        
-        # Set up API client
-        self.client = APIClient()
 
 
 ### Equivalent Classes for Adding Edition ###
@@ -1415,14 +1349,15 @@ class AddEditionToShelfTests(ShelfEditionBaseTest):
     """
     Test Module for adding editions to shelves based on listed equivalence classes
     """
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Additional setup for add edition tests
+        Additional setup for add edition tests: URLs resolved once per class
         """
-        super().setUp()
-        self.add_edition_url = reverse("shelf-add-edition", kwargs={"pk": self.shelf.pk})
-        self.add_to_private_url = reverse("shelf-add-edition", kwargs={"pk": self.private_shelf.pk})
-        self.add_to_other_url = reverse("shelf-add-edition", kwargs={"pk": self.other_user_shelf.pk})
+        super().setUpTestData()
+        cls.add_edition_url = reverse("shelf-add-edition", kwargs={"pk": cls.shelf.pk})
+        cls.add_to_private_url = reverse("shelf-add-edition", kwargs={"pk": cls.private_shelf.pk})
+        cls.add_to_other_url = reverse("shelf-add-edition", kwargs={"pk": cls.other_user_shelf.pk})
     
     # Authentication Status: Authenticated user (valid)
     def test_add_edition_authenticated_user(self):
@@ -1443,23 +1378,6 @@ class AddEditionToShelfTests(ShelfEditionBaseTest):
             ).exists()
         )
     
-    # Authentication Status: Unauthenticated user (invalid)
-    def test_add_edition_unauthenticated_user(self):
-        """Test that an unauthenticated user cannot add an edition to a shelf"""
-        data = {
-            'edition_id': self.edition1.pk
-        }
-        
-        response = self.client.post(self.add_edition_url, data, format='json')
-        
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-        self.assertFalse(
-            ShelfEdition.objects.filter(
-                shelf=self.shelf,
-                edition=self.edition1
-            ).exists()
-        )
-    
     # Shelf Ownership: User is shelf owner (valid)
     def test_add_edition_to_own_shelf(self):
         """Test that a user can add an edition to their own shelf"""
@@ -1472,11 +1390,12 @@ class AddEditionToShelfTests(ShelfEditionBaseTest):
         response = self.client.post(self.add_edition_url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertTrue(
-            ShelfEdition.objects.filter(
-                shelf=self.shelf,
-                edition=self.edition1
-            ).exists()
+        shelf_edition = ShelfEdition.objects.get(shelf=self.shelf, edition=self.edition1)
+        
+        # The response only carries the ids of the new relationship
+        self.assertEqual(
+            response.data,
+            {"id": shelf_edition.pk, "edition_id": self.edition1.pk, "shelf_id": self.shelf.pk}
         )
     
     # Shelf Ownership: User is not shelf owner (invalid)
@@ -1525,6 +1444,11 @@ class AddEditionToShelfTests(ShelfEditionBaseTest):
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('non_field_errors', response.data)
+        
+        # The failed insert is rolled back and the original placement is kept
+        self.assertEqual(
+            ShelfEdition.objects.filter(shelf=self.shelf, edition=self.edition3).count(), 1
+        )
     
     # Multiple Editions of Same Book: Different editions of same book (valid)
     def test_add_multiple_editions_of_same_book(self):
@@ -1541,76 +1465,173 @@ class AddEditionToShelfTests(ShelfEditionBaseTest):
         response2 = self.client.post(self.add_edition_url, data2, format='json')
         self.assertEqual(response2.status_code, status.HTTP_201_CREATED)
         
-        # Verify both editions are on the shelf
-        self.assertTrue(
-            ShelfEdition.objects.filter(
-                shelf=self.shelf,
-                edition=self.edition1
-            ).exists()
-        )
-        self.assertTrue(
+        # Verify both editions are on the shelf, in a single query
+        self.assertEqual(
             ShelfEdition.objects.filter(
                 shelf=self.shelf,
-                edition=self.edition2
-            ).exists()
+                edition__in=[self.edition1, self.edition2]
+            ).count(),
+            2
         )
 
 
-### Equivalent Classes for Removing Edition ###
-##  Authentication Status ##
-#       Authenticated user              (valid)
-#       Unauthenticated user            (invalid)
+### Equivalent Classes for Adding Editions in Bulk ###
 ##  Shelf Ownership ##
 #       User is shelf owner             (valid)
 #       User is not shelf owner         (invalid)
-##  ShelfEdition Existence ##
-#       Edition is on shelf             (valid)
-#       Edition is not on shelf         (invalid)
+##  Edition Existence ##
+#       All editions exist              (valid)
+#       Some edition does not exist     (invalid)
 ##  Request Parameters ##
-#       Contains valid edition_id param (valid)
-#       Missing edition_id param        (invalid)
+#       Non-empty edition_ids list      (valid)
+#       Empty edition_ids list          (invalid)
+##  Duplicate Check ##
+#       Edition already on shelf        (valid - skipped)
 
-class RemoveEditionFromShelfTests(ShelfEditionBaseTest):
+class AddEditionsToShelfTests(ShelfEditionBaseTest):
     """
-    Test Module for removing editions from shelves based on listed equivalence classes
+    Test Module for adding several editions to a shelf at once based on listed equivalence classes
     """
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Additional setup for remove edition tests
+        Additional setup for bulk add tests: URLs resolved once per class
         """
-        super().setUp()
-        self.remove_edition_url = reverse("shelf-remove-edition", kwargs={"pk": self.shelf.pk})
-        self.remove_from_private_url = reverse("shelf-remove-edition", kwargs={"pk": self.private_shelf.pk})
-        self.remove_from_other_url = reverse("shelf-remove-edition", kwargs={"pk": self.other_user_shelf.pk})
+        super().setUpTestData()
+        cls.add_editions_url = reverse("shelf-add-editions", kwargs={"pk": cls.shelf.pk})
+        cls.add_to_other_url = reverse("shelf-add-editions", kwargs={"pk": cls.other_user_shelf.pk})
     
-    # Authentication Status: Authenticated user (valid)
-    def test_remove_edition_authenticated_user(self):
-        """Test that an authenticated user can remove an edition from their shelf"""
+    # Shelf Ownership: User is shelf owner (valid)
+    # Duplicate Check: Edition already on shelf (valid - skipped)
+    def test_add_editions_to_own_shelf(self):
+        """Test that a user can add several editions to their own shelf, skipping ones already on it"""
         self.client.force_authenticate(user=self.user)
         
-        # URL with query parameter
-        remove_url = f"{self.remove_edition_url}?edition_id={self.edition3.pk}"
+        data = {
+            'edition_ids': [self.edition1.pk, self.edition2.pk, self.edition3.pk]
+        }
         
-        response = self.client.delete(remove_url)
+        response = self.client.post(self.add_editions_url, data, format='json')
         
-        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
-        self.assertFalse(
-            ShelfEdition.objects.filter(
-                shelf=self.shelf,
-                edition=self.edition3
-            ).exists()
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            set(ShelfEdition.objects.filter(shelf=self.shelf).values_list("edition_id", flat=True)),
+            {self.edition1.pk, self.edition2.pk, self.edition3.pk}
         )
     
-    # Authentication Status: Unauthenticated user (invalid)
-    def test_remove_edition_unauthenticated_user(self):
-        """Test that an unauthenticated user cannot remove an edition from a shelf"""
-        # URL with query parameter
-        remove_url = f"{self.remove_edition_url}?edition_id={self.edition3.pk}"
-        
-        response = self.client.delete(remove_url)
+    # Shelf Ownership: User is not shelf owner (invalid)
+    def test_add_editions_to_others_shelf(self):
+        """Test that a user cannot add editions to another user's shelf"""
+        self.client.force_authenticate(user=self.user)
         
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-        self.assertTrue(
+        data = {
+            'edition_ids': [self.edition2.pk, self.edition3.pk]
+        }
+        
+        response = self.client.post(self.add_to_other_url, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(ShelfEdition.objects.filter(shelf=self.other_user_shelf).count(), 1)
+    
+    # Edition Existence: Some edition does not exist (invalid)
+    def test_add_editions_nonexistent_edition(self):
+        """Test that nothing is added when any of the editions does not exist"""
+        self.client.force_authenticate(user=self.user)
+        
+        data = {
+            'edition_ids': [self.edition1.pk, 99999]
+        }
+        
+        response = self.client.post(self.add_editions_url, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(
+            ShelfEdition.objects.filter(
+                shelf=self.shelf,
+                edition=self.edition1
+            ).exists()
+        )
+    
+    # Request Parameters: Empty edition_ids list (invalid)
+    def test_add_editions_empty_list(self):
+        """Test that an empty edition_ids list is rejected"""
+        self.client.force_authenticate(user=self.user)
+        
+        response = self.client.post(self.add_editions_url, {'edition_ids': []}, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    
+    def test_add_editions_query_count_independent_of_size(self):
+        """Test that adding many editions costs the same number of queries as adding one"""
+        self.client.force_authenticate(user=self.user)
+        
+        editions = Edition.objects.bulk_create([
+            Edition(
+                book=self.book,
+                isbn=f"97800000{i:05d}",
+                kind="Paperback",
+                publication_year=2020,
+                language="English"
+            )
+            for i in range(20)
+        ])
+        
+        data = {
+            'edition_ids': [edition.pk for edition in editions]
+        }
+        
+        with self.assertNumQueries(5):
+            response = self.client.post(
+                reverse("shelf-add-editions", kwargs={"pk": self.empty_shelf.pk}),
+                data,
+                format='json'
+            )
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(ShelfEdition.objects.filter(shelf=self.empty_shelf).count(), 20)
+
+
+### Equivalent Classes for Removing Edition ###
+##  Authentication Status ##
+#       Authenticated user              (valid)
+#       Unauthenticated user            (invalid)
+##  Shelf Ownership ##
+#       User is shelf owner             (valid)
+#       User is not shelf owner         (invalid)
+##  ShelfEdition Existence ##
+#       Edition is on shelf             (valid)
+#       Edition is not on shelf         (invalid)
+##  Request Parameters ##
+#       Contains valid edition_id param (valid)
+#       Missing edition_id param        (invalid)
+
+class RemoveEditionFromShelfTests(ShelfEditionBaseTest):
+    """
+    Test Module for removing editions from shelves based on listed equivalence classes
+    """
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Additional setup for remove edition tests: URLs resolved once per class
+        """
+        super().setUpTestData()
+        cls.remove_edition_url = reverse("shelf-remove-edition", kwargs={"pk": cls.shelf.pk})
+        cls.remove_from_private_url = reverse("shelf-remove-edition", kwargs={"pk": cls.private_shelf.pk})
+        cls.remove_from_other_url = reverse("shelf-remove-edition", kwargs={"pk": cls.other_user_shelf.pk})
+    
+    # Authentication Status: Authenticated user (valid)
+    def test_remove_edition_authenticated_user(self):
+        """Test that an authenticated user can remove an edition from their shelf"""
+        self.client.force_authenticate(user=self.user)
+        
+        # Pass edition_id as a query parameter
+        response = self.client.delete(
+            self.remove_edition_url,
+            QUERY_STRING=urlencode({"edition_id": self.edition3.pk})
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(
             ShelfEdition.objects.filter(
                 shelf=self.shelf,
                 edition=self.edition3
@@ -1622,10 +1643,12 @@ class RemoveEditionFromShelfTests(ShelfEditionBaseTest):
         """Test that a user can remove an edition from their own shelf"""
         self.client.force_authenticate(user=self.user)
         
-        # URL with query parameter
-        remove_url = f"{self.remove_edition_url}?edition_id={self.edition3.pk}"
-        
-        response = self.client.delete(remove_url)
+        # Pass edition_id as a query parameter
+        with self.assertNumQueries(5):
+            response = self.client.delete(
+                self.remove_edition_url,
+                QUERY_STRING=urlencode({"edition_id": self.edition3.pk})
+            )
         
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(
@@ -1640,10 +1663,13 @@ class RemoveEditionFromShelfTests(ShelfEditionBaseTest):
         """Test that a user cannot remove an edition from another user's shelf"""
         self.client.force_authenticate(user=self.other_user)
         
-        # URL with query parameter
-        remove_url = f"{self.remove_edition_url}?edition_id={self.edition3.pk}"
-        
-        response = self.client.delete(remove_url)
+        # Pass edition_id as a query parameter. The ownership check must be
+        # answered by the single shelf lookup (owner joined in), not re-queried
+        with self.assertNumQueries(1):
+            response = self.client.delete(
+                self.remove_edition_url,
+                QUERY_STRING=urlencode({"edition_id": self.edition3.pk})
+            )
         
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         self.assertTrue(
@@ -1658,10 +1684,12 @@ class RemoveEditionFromShelfTests(ShelfEditionBaseTest):
         """Test removing an edition that is not on the shelf"""
         self.client.force_authenticate(user=self.user)
         
-        # URL with query parameter for edition not on this shelf
-        remove_url = f"{self.remove_edition_url}?edition_id={self.edition1.pk}"
-        
-        response = self.client.delete(remove_url)
+        # Query parameter for edition not on this shelf
+        with self.assertNumQueries(4):
+            response = self.client.delete(
+                self.remove_edition_url,
+                QUERY_STRING=urlencode({"edition_id": self.edition1.pk})
+            )
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
     
@@ -1698,34 +1726,30 @@ class ListEditionsOnShelfTests(ShelfEditionBaseTest):
     """
     Test Module for listing editions on shelves based on listed equivalence classes
     """
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Additional setup for list edition tests
+        Additional setup for list edition tests: URLs resolved once per class
         """
-        super().setUp()
-        self.list_editions_url = reverse("shelf-editions", kwargs={"pk": self.shelf.pk})
-        self.list_private_url = reverse("shelf-editions", kwargs={"pk": self.private_shelf.pk})
-        self.list_other_url = reverse("shelf-editions", kwargs={"pk": self.other_user_shelf.pk})
-        self.list_other_private_url = reverse("shelf-editions", kwargs={"pk": self.other_private_shelf.pk})
-        self.list_empty_url = reverse("shelf-editions", kwargs={"pk": self.empty_shelf.pk})
+        super().setUpTestData()
+        cls.list_editions_url = reverse("shelf-editions", kwargs={"pk": cls.shelf.pk})
+        cls.list_private_url = reverse("shelf-editions", kwargs={"pk": cls.private_shelf.pk})
+        cls.list_other_url = reverse("shelf-editions", kwargs={"pk": cls.other_user_shelf.pk})
+        cls.list_other_private_url = reverse("shelf-editions", kwargs={"pk": cls.other_private_shelf.pk})
+        cls.list_empty_url = reverse("shelf-editions", kwargs={"pk": cls.empty_shelf.pk})
     
     # Authentication Status: Authenticated user (valid)
     def test_list_editions_authenticated_user(self):
         """Test listing editions on a shelf when user is authenticated"""
         self.client.force_authenticate(user=self.user)
         
-        response = self.client.get(self.list_editions_url)
+        # Pin the query count to catch N+1 regressions
+        with self.assertNumQueries(4):
+            response = self.client.get(self.list_editions_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)  # One edition on this shelf
     
-    # Authentication Status: Unauthenticated user (invalid)
-    def test_list_editions_unauthenticated_user(self):
-        """Test listing editions on a shelf when user is not authenticated"""
-        response = self.client.get(self.list_editions_url)
-        
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-    
     # Shelf Visibility: Public shelf (valid - any authenticated user can view)
     def test_list_editions_public_shelf_other_user(self):
         """Test listing editions on a public shelf as a different user"""
@@ -1764,6 +1788,199 @@ class ListEditionsOnShelfTests(ShelfEditionBaseTest):
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 0)  # Empty list
+    
+    # Shelf Content: Query count does not grow with the number of editions (valid)
+    def test_list_editions_query_count_independent_of_size(self):
+        """Test that listing a large shelf uses the same number of queries as a small one"""
+        self.client.force_authenticate(user=self.user)
+        
+        # Give the book an author and seed the empty shelf with 20 editions,
+        # each with a cover image, so every serialized field hits a relation
+        author = Author.objects.create(name="Test Author", author_id="test-author")
+        BookAuthor.objects.create(book=self.book, author=author)
+        editions = Edition.objects.bulk_create([
+            Edition(
+                book=self.book,
+                isbn=f"97800000000{i:02d}",
+                publisher=self.publisher,
+                kind="Paperback",
+                publication_year=2000 + i,
+                language="English"
+            )
+            for i in range(20)
+        ])
+        CoverImage.objects.bulk_create([
+            CoverImage(edition=edition, image_url=f"https://example.com/{edition.isbn}.jpg", is_primary=True)
+            for edition in editions
+        ])
+        ShelfEdition.objects.bulk_create([
+            ShelfEdition(shelf=self.empty_shelf, edition=edition) for edition in editions
+        ])
+        
+        # Shelf, shelf editions (joined to edition and book), authors, cover images
+        with self.assertNumQueries(4):
+            response = self.client.get(self.list_empty_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 20)
+        self.assertEqual(response.data[0]['authors'], [{'id': author.id, 'name': "Test Author"}])
+        self.assertTrue(response.data[0]['cover_image'].startswith("https://example.com/"))
+
+class UnauthenticatedShelfTests(SimpleTestCase):
+    """
+    Test Module for unauthenticated requests to every shelf endpoint.
+
+    DRF rejects these with 401 before the view runs, so no fixtures are
+    needed and the tests skip the database entirely. SimpleTestCase raises
+    if any query is made, which also guarantees nothing was written.
+    """
+    databases = set()
+    client_class = APIClient
+
+    # Any pk will do since the request never reaches a shelf lookup
+    shelf_pk = 1
+    edition_pk = 1
+
+    def test_list_shelves_user_unauthenticated(self):
+        """Test listing shelves when user is unauthenticated"""
+        response = self.client.get(reverse("shelf-list"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_retrieve_shelf_unauthenticated(self):
+        """Test retrieving any shelf while unauthenticated (invalid)."""
+        response = self.client.get(reverse("shelf-detail", kwargs={"pk": self.shelf_pk}))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_update_shelf_unauthenticated(self):
+        """Updating a shelf when user is unauthenticated (invalid)."""
+        response = self.client.patch(
+            reverse("shelf-detail", kwargs={"pk": self.shelf_pk}),
+            {'name': 'New Name'},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_delete_shelf_unauthenticated_user(self):
+        """Test that an unauthenticated user cannot delete any shelf (invalid)."""
+        response = self.client.delete(reverse("shelf-detail", kwargs={"pk": self.shelf_pk}))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_add_edition_unauthenticated_user(self):
+        """Test that an unauthenticated user cannot add an edition to a shelf"""
+        response = self.client.post(
+            reverse("shelf-add-edition", kwargs={"pk": self.shelf_pk}),
+            {'edition_id': self.edition_pk},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_remove_edition_unauthenticated_user(self):
+        """Test that an unauthenticated user cannot remove an edition from a shelf"""
+        response = self.client.delete(
+            reverse("shelf-remove-edition", kwargs={"pk": self.shelf_pk}),
+            QUERY_STRING=urlencode({"edition_id": self.edition_pk})
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_list_editions_unauthenticated_user(self):
+        """Test listing editions on a shelf when user is not authenticated"""
+        response = self.client.get(reverse("shelf-editions", kwargs={"pk": self.shelf_pk}))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+class BaseUserBookFixtures(TestCase):
+    """
+    Base test class with the book graph shared by the UserBook and
+    read status tests
+    """
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Create the books and editions once per class.
+        """
+        cls.book = Book.objects.create(title="Test Book", book_id="test123")
+        
+        # Create hardcover and paperback editions of the book in a single
+        # INSERT. Publisher is nullable and nothing here reads it, so it is
+        # left unset
+        cls.hardcover_edition, cls.paperback_edition = Edition.objects.bulk_create([
+            Edition(
+                book=cls.book,
+                isbn="9781234567890",
+                kind="Hardcover",
+                publication_year=2020,
+                language="English"
+            ),
+            Edition(
+                book=cls.book,
+                isbn="9780987654321",
+                kind="Paperback",
+                publication_year=2021,
+                language="English"
+            ),
+        ])
+        
+        # Serialize the add_edition request bodies once so each POST skips
+        # DRF's renderer lookup
+        cls.hardcover_body = json.dumps({"edition_id": cls.hardcover_edition.pk})
+        cls.paperback_body = json.dumps({"edition_id": cls.paperback_edition.pk})
+
+    @classmethod
+    def _resolve_shelf_urls(cls):
+        """
+        Resolve the add/remove edition URLs for the five shelves once per class,
+        after a subclass's setUpTestData has created them.
+        """
+        # Set up URLs for adding editions to shelves
+        cls.add_to_read_url = reverse("shelf-add-edition", kwargs={"pk": cls.read_shelf.pk})
+        cls.add_to_reading_url = reverse("shelf-add-edition", kwargs={"pk": cls.reading_shelf.pk})
+        cls.add_to_want_url = reverse("shelf-add-edition", kwargs={"pk": cls.want_to_read_shelf.pk})
+        cls.add_to_owned_url = reverse("shelf-add-edition", kwargs={"pk": cls.owned_shelf.pk})
+        cls.add_to_custom_url = reverse("shelf-add-edition", kwargs={"pk": cls.custom_shelf.pk})
+        
+        # Set up URLs for removing editions from shelves
+        cls.remove_from_read_url = reverse("shelf-remove-edition", kwargs={"pk": cls.read_shelf.pk})
+        cls.remove_from_reading_url = reverse("shelf-remove-edition", kwargs={"pk": cls.reading_shelf.pk})
+        cls.remove_from_want_url = reverse("shelf-remove-edition", kwargs={"pk": cls.want_to_read_shelf.pk})
+        cls.remove_from_owned_url = reverse("shelf-remove-edition", kwargs={"pk": cls.owned_shelf.pk})
+        cls.remove_from_custom_url = reverse("shelf-remove-edition", kwargs={"pk": cls.custom_shelf.pk})
+
+    def _seed_shelf(self, shelf, edition, read_status=None, owned=False):
+        """
+        Put an edition on a shelf and set the user's UserBook for its book
+        directly through the ORM, to reach the state under test without
+        going through the add_edition endpoint.
+        
+        Args:
+            shelf: The Shelf to place the edition on
+            edition: The Edition to place
+            read_status: The expected UserBook read_status afterwards
+            owned: The expected UserBook is_owned afterwards
+        """
+        with transaction.atomic():
+            ShelfEdition.objects.create(shelf=shelf, edition=edition)
+            UserBook.objects.update_or_create(
+                user=self.user,
+                book=edition.book,
+                defaults={"read_status": read_status, "is_owned": owned}
+            )
+
+    def _shelf_ids_holding(self, edition):
+        """
+        Fetch the ids of self.user's shelves holding edition in a single query.
+        """
+        return set(
+            ShelfEdition.objects.filter(edition=edition, shelf__user=self.user).values_list("shelf_id", flat=True)
+        )
+
+    def _userbook_rows(self):
+        """
+        Fetch self.user's UserBook rows for self.book in a single query.
+        """
+        return list(
+            UserBook.objects.filter(user=self.user, book=self.book).values("read_status", "is_owned")
+        )
 
 ### Equivalent Classes ###
 ##  UserBook Creation ##
@@ -1782,222 +1999,111 @@ class ListEditionsOnShelfTests(ShelfEditionBaseTest):
 #       Removing edition from status shelf but still owned keeps UserBook      (valid)
 #       Removing edition from owned shelf but still in status keeps UserBook   (valid)
 #       Removing same book's different edition updates same UserBook           (valid)
+#       Removing falls back to the highest precedence remaining status         (valid)
 
-class UserBookEntityTests(TestCase):
+class UserBookEntityTests(BaseUserBookFixtures):
     """
-    Test Module for UserBook entity updates based on shelf operations
+    Test Module for UserBook entity updates based on shelf operations.
+    The request under test is pinned with assertNumQueries so query
+    count regressions in the shelf views fail loudly.
     """
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Create test (mock) data for UserBook tests.
-        Test user, books, editions, shelves and API client.
+        Create test (mock) data once for the UserBook tests.
+        Test user, shelves and URLs on top of the shared book graph.
         """
-        # Create a test user
-        self.user = User.objects.create_user(
+        super().setUpTestData()
+
+        # Create a test user. These tests only use force_authenticate, so the
+        # user gets an unusable password and no hasher runs at all
+        cls.user = User.objects.create_user(
             username="userbook_tester",
-            email="userbook@example.com",
-            password="testpassword"
-        )
-        
-        # Create reading status shelves
-        self.read_shelf = Shelf.objects.create(
-            user=self.user,
-            name="Read Books",
-            shelf_type="Read",
-            is_private=False
-        )
-        
-        self.reading_shelf = Shelf.objects.create(
-            user=self.user,
-            name="Currently Reading",
-            shelf_type="Reading",
-            is_private=False
-        )
-        
-        self.want_to_read_shelf = Shelf.objects.create(
-            user=self.user,
-            name="Want to Read",
-            shelf_type="Want to Read",
-            is_private=False
-        )
+            email="userbook@example.com"
+        )
+        
+        # Create reading status, Owned and Custom shelves in a single INSERT
+        (
+            cls.read_shelf,
+            cls.reading_shelf,
+            cls.want_to_read_shelf,
+            cls.owned_shelf,
+            cls.custom_shelf,
+        ) = Shelf.objects.bulk_create([
+            Shelf(user=cls.user, name="Read Books", shelf_type="Read", is_private=False),
+            Shelf(user=cls.user, name="Currently Reading", shelf_type="Reading", is_private=False),
+            Shelf(user=cls.user, name="Want to Read", shelf_type="Want to Read", is_private=False),
+            Shelf(user=cls.user, name="Owned Books", shelf_type="Owned", is_private=False),
+            Shelf(user=cls.user, name="Custom Shelf", shelf_type="Custom", is_private=False),
+        ])
+        
+        cls._resolve_shelf_urls()
 
-        self.owned_shelf = Shelf.objects.create(
-            user=self.user,
-            name="Owned Books",
-            shelf_type="Owned",
-            is_private=False
-        )
-        
-        self.custom_shelf = Shelf.objects.create(
-            user=self.user,
-            name="Custom Shelf",
-            shelf_type="Custom",
-            is_private=False
-        )
-        
-        # Create book and editions
-        self.book = Book.objects.create(
-            title="Test Book",
-            book_id="test123"
-        )
-        
-        self.publisher = Publisher.objects.create(name="Test Publisher")
-        
-        self.hardcover_edition = Edition.objects.create(
-            book=self.book,
-            isbn="9781234567890",
-            publisher=self.publisher,
-            kind="Hardcover",
-            publication_year=2020,
-            language="English"
-        )
-        
-        self.paperback_edition = Edition.objects.create(
-            book=self.book,
-            isbn="9780987654321",
-            publisher=self.publisher,
-            kind="Paperback",
-            publication_year=2021,
-            language="English"
-        )
-        
-        # Create a second book and edition for additional tests
-        self.book2 = Book.objects.create(
-            title="Second Test Book",
-            book_id="test456"
-        )
-        
-        self.book2_edition = Edition.objects.create(
-            book=self.book2,
-            isbn="9781122334455",
-            publisher=self.publisher,
-            kind="Hardcover",
-            publication_year=2022,
-            language="English"
-        )
-        
-        # Set up API client
-        self.client = APIClient()
+    def setUp(self):
+        """
+        Authenticate the per-test API client as the test user.
+        """
         self.client.force_authenticate(user=self.user)
-        
-        # Set up URLs for adding editions to shelves
-        self.add_to_read_url = reverse("shelf-add-edition", kwargs={"pk": self.read_shelf.pk})
-        self.add_to_reading_url = reverse("shelf-add-edition", kwargs={"pk": self.reading_shelf.pk})
-        self.add_to_want_url = reverse("shelf-add-edition", kwargs={"pk": self.want_to_read_shelf.pk})
-        self.add_to_owned_url = reverse("shelf-add-edition", kwargs={"pk": self.owned_shelf.pk})
-        self.add_to_custom_url = reverse("shelf-add-edition", kwargs={"pk": self.custom_shelf.pk})
-        
-        # Set up URLs for removing editions from shelves
-        self.remove_from_read_url = reverse("shelf-remove-edition", kwargs={"pk": self.read_shelf.pk})
-        self.remove_from_reading_url = reverse("shelf-remove-edition", kwargs={"pk": self.reading_shelf.pk})
-        self.remove_from_want_url = reverse("shelf-remove-edition", kwargs={"pk": self.want_to_read_shelf.pk})
-        self.remove_from_owned_url = reverse("shelf-remove-edition", kwargs={"pk": self.owned_shelf.pk})
-        self.remove_from_custom_url = reverse("shelf-remove-edition", kwargs={"pk": self.custom_shelf.pk})
-    
+
     ### Actual tests ###
     
     ## UserBook Creation
     
-    # Adding edition to Read shelf creates UserBook with Read status (valid)
-    def test_adding_to_read_shelf_creates_userbook(self):
-        """Test adding edition to Read shelf creates UserBook with Read status"""
-        # Verify no UserBook exists initially
-        self.assertFalse(UserBook.objects.filter(user=self.user, book=self.book).exists())
-        
-        # Add edition to Read shelf
-        response = self.client.post(
-            self.add_to_read_url,
-            {"edition_id": self.hardcover_edition.pk},
-            format="json"
-        )
-        
-        # Verify success and UserBook creation
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertTrue(UserBook.objects.filter(user=self.user, book=self.book).exists())
-        
-        # Verify UserBook has correct Read status
-        user_book = UserBook.objects.get(user=self.user, book=self.book)
-        self.assertEqual(user_book.read_status, "Read")
-        self.assertFalse(user_book.is_owned)
-    
-    # Adding edition to Reading shelf creates UserBook with Reading status (valid)
-    def test_adding_to_reading_shelf_creates_userbook(self):
-        """Test adding edition to Reading shelf creates UserBook with Reading status"""
-        # Verify no UserBook exists initially
-        self.assertFalse(UserBook.objects.filter(user=self.user, book=self.book).exists())
-        
-        # Add edition to Reading shelf
-        response = self.client.post(
-            self.add_to_reading_url,
-            {"edition_id": self.hardcover_edition.pk},
-            format="json"
-        )
-        
-        # Verify success and UserBook creation
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertTrue(UserBook.objects.filter(user=self.user, book=self.book).exists())
-        
-        # Verify UserBook has correct Reading status
-        user_book = UserBook.objects.get(user=self.user, book=self.book)
-        self.assertEqual(user_book.read_status, "Reading")
-        self.assertFalse(user_book.is_owned)
-    
-    # Adding edition to Want to Read shelf creates UserBook with Want status (valid)
-    def test_adding_to_want_shelf_creates_userbook(self):
-        """Test adding edition to Want to Read shelf creates UserBook with Want to Read status"""
-        # Verify no UserBook exists initially
-        self.assertFalse(UserBook.objects.filter(user=self.user, book=self.book).exists())
-        
-        # Add edition to Want to Read shelf
-        response = self.client.post(
-            self.add_to_want_url,
-            {"edition_id": self.hardcover_edition.pk},
-            format="json"
-        )
-        
-        # Verify success and UserBook creation
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertTrue(UserBook.objects.filter(user=self.user, book=self.book).exists())
-        
-        # Verify UserBook has correct Want to Read status
-        user_book = UserBook.objects.get(user=self.user, book=self.book)
-        self.assertEqual(user_book.read_status, "Want to Read")
-        self.assertFalse(user_book.is_owned)
+    # Adding edition to each status shelf creates UserBook with that status (valid)
+    def test_adding_to_status_shelf_creates_userbook(self):
+        """
+        Test adding edition to each status shelf creates UserBook with that
+        read status. Each shelf runs in its own rolled back savepoint so the
+        cases share one test's fixture setup.
+        """
+        cases = [
+            (self.add_to_read_url, "Read"),
+            (self.add_to_reading_url, "Reading"),
+            (self.add_to_want_url, "Want to Read"),
+        ]
+        
+        for url, read_status in cases:
+            with self.subTest(status=read_status), transaction.atomic():
+                # Add edition to the status shelf
+                with self.assertNumQueries(7):
+                    response = self.client.post(url, self.hardcover_body, content_type="application/json")
+                
+                # Verify success
+                self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+                
+                # Verify UserBook was created with the shelf's status
+                self.assertEqual(self._userbook_rows(), [{"read_status": read_status, "is_owned": False}])
+                
+                # Undo this case before the next one runs
+                transaction.set_rollback(True)
     
     # Adding edition to Owned shelf creates UserBook with is_owned=True (valid)
     def test_adding_to_owned_shelf_creates_userbook(self):
         """Test adding edition to Owned shelf creates UserBook with is_owned=True"""
-        # Verify no UserBook exists initially
-        self.assertFalse(UserBook.objects.filter(user=self.user, book=self.book).exists())
-        
         # Add edition to Owned shelf
-        response = self.client.post(
-            self.add_to_owned_url,
-            {"edition_id": self.hardcover_edition.pk},
-            format="json"
-        )
+        with self.assertNumQueries(6):
+            response = self.client.post(
+                self.add_to_owned_url,
+                self.hardcover_body,
+                content_type="application/json"
+            )
         
-        # Verify success and UserBook creation
+        # Verify success
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertTrue(UserBook.objects.filter(user=self.user, book=self.book).exists())
         
-        # Verify UserBook has correct ownership status
-        user_book = UserBook.objects.get(user=self.user, book=self.book)
-        self.assertTrue(user_book.is_owned)
-        self.assertIsNone(user_book.read_status)  # Now expecting None instead of "Want to Read"
+        # Verify UserBook was created with correct ownership status
+        self.assertEqual(self._userbook_rows(), [{"read_status": None, "is_owned": True}])
 
     # Adding edition to Custom shelf does not create UserBook (valid)
     def test_adding_to_custom_shelf_does_not_create_userbook(self):
         """Test adding edition to Custom shelf does not create a UserBook"""
-        # Verify no UserBook exists initially
-        self.assertFalse(UserBook.objects.filter(user=self.user, book=self.book).exists())
-        
         # Add edition to Custom shelf
-        response = self.client.post(
-            self.add_to_custom_url,
-            {"edition_id": self.hardcover_edition.pk},
-            format="json"
-        )
+        with self.assertNumQueries(5):
+            response = self.client.post(
+                self.add_to_custom_url,
+                self.hardcover_body,
+                content_type="application/json"
+            )
         
         # Verify success
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
@@ -2010,256 +2116,171 @@ class UserBookEntityTests(TestCase):
     # Migrating edition between status shelves updates read_status (valid)
     def test_migrating_between_status_shelves_updates_userbook(self):
         """Test migrating edition between status shelves updates UserBook read_status"""
-        # Add edition to Want to Read shelf
-        self.client.post(
-            self.add_to_want_url,
-            {"edition_id": self.hardcover_edition.pk},
-            format="json"
-        )
-        
-        # Verify initial UserBook status
-        user_book = UserBook.objects.get(user=self.user, book=self.book)
-        self.assertEqual(user_book.read_status, "Want to Read")
+        # Start with the edition on the Want to Read shelf
+        self._seed_shelf(self.want_to_read_shelf, self.hardcover_edition, read_status="Want to Read")
         
         # Move to Reading shelf
-        response = self.client.post(
-            self.add_to_reading_url,
-            {"edition_id": self.hardcover_edition.pk},
-            format="json"
-        )
+        with self.assertNumQueries(7):
+            response = self.client.post(
+                self.add_to_reading_url,
+                self.hardcover_body,
+                content_type="application/json"
+            )
         
         # Verify success and updated UserBook
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        user_book.refresh_from_db()
-        self.assertEqual(user_book.read_status, "Reading")
+        self.assertEqual(self._userbook_rows(), [{"read_status": "Reading", "is_owned": False}])
     
     # Adding edition to multiple status shelves only keeps last one (valid)
     def test_adding_to_multiple_status_shelves_only_keeps_last(self):
         """Test adding edition to multiple status shelves only keeps it on the last one"""
-        # Add edition to all three status shelves in sequence
-        self.client.post(
-            self.add_to_want_url,
-            {"edition_id": self.hardcover_edition.pk},
-            format="json"
-        )
-        
-        self.client.post(
-            self.add_to_reading_url,
-            {"edition_id": self.hardcover_edition.pk},
-            format="json"
-        )
+        # Start with the edition on the Reading shelf (as if added to Want to
+        # Read and then Reading), then add it to the Read shelf
+        self._seed_shelf(self.reading_shelf, self.hardcover_edition, read_status="Reading")
         
-        self.client.post(
-            self.add_to_read_url,
-            {"edition_id": self.hardcover_edition.pk},
-            format="json"
-        )
+        with self.assertNumQueries(7):
+            self.client.post(
+                self.add_to_read_url,
+                self.hardcover_body,
+                content_type="application/json"
+            )
         
         # Verify edition is only on Read shelf
-        self.assertTrue(
-            ShelfEdition.objects.filter(
-                shelf=self.read_shelf,
-                edition=self.hardcover_edition
-            ).exists()
-        )
-        
-        self.assertFalse(
-            ShelfEdition.objects.filter(
-                shelf=self.reading_shelf,
-                edition=self.hardcover_edition
-            ).exists()
-        )
-        
-        self.assertFalse(
-            ShelfEdition.objects.filter(
-                shelf=self.want_to_read_shelf,
-                edition=self.hardcover_edition
-            ).exists()
-        )
+        self.assertEqual(self._shelf_ids_holding(self.hardcover_edition), {self.read_shelf.pk})
         
         # Verify UserBook has final status
-        user_book = UserBook.objects.get(user=self.user, book=self.book)
-        self.assertEqual(user_book.read_status, "Read")
+        self.assertEqual(self._userbook_rows(), [{"read_status": "Read", "is_owned": False}])
     
-    # Adding edition to Owned shelf sets is_owned=True (valid)
-    def test_adding_to_owned_sets_is_owned(self):
-        """Test adding edition to Owned shelf sets UserBook is_owned=True"""
-        # Add edition to Owned shelf
-        response = self.client.post(
-            self.add_to_owned_url,
-            {"edition_id": self.hardcover_edition.pk},
-            format="json"
-        )
-        
-        # Verify success and UserBook ownership
+    # Adding editions in bulk to a status shelf migrates and updates the UserBook (valid)
+    def test_bulk_adding_to_status_shelf_updates_userbook(self):
+        """Test adding both editions at once to Read moves the book off Reading and sets its status"""
+        # Start with the hardcover on the Reading shelf
+        self._seed_shelf(self.reading_shelf, self.hardcover_edition, read_status="Reading")
+        
+        with self.assertNumQueries(7):
+            response = self.client.post(
+                reverse("shelf-add-editions", kwargs={"pk": self.read_shelf.pk}),
+                {"edition_ids": [self.hardcover_edition.pk, self.paperback_edition.pk]},
+                format="json"
+            )
+        
+        # Verify both editions are only on the Read shelf and the UserBook followed
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        user_book = UserBook.objects.get(user=self.user, book=self.book)
-        self.assertTrue(user_book.is_owned)
-    
-    # Adding edition to both status and Owned keeps both properties (valid)
-    def test_adding_to_status_and_owned_keeps_both_properties(self):
-        """Test adding edition to both status and Owned shelves keeps both properties"""
-        # Add edition to Read shelf
-        self.client.post(
-            self.add_to_read_url,
-            {"edition_id": self.hardcover_edition.pk},
-            format="json"
-        )
-        
-        # Add edition to Owned shelf
-        self.client.post(
-            self.add_to_owned_url,
-            {"edition_id": self.hardcover_edition.pk},
-            format="json"
-        )
-        
-        # Verify UserBook has both properties
-        user_book = UserBook.objects.get(user=self.user, book=self.book)
-        self.assertEqual(user_book.read_status, "Read")
-        self.assertTrue(user_book.is_owned)
-        
-        # Verify edition is on both shelves
-        self.assertTrue(
-            ShelfEdition.objects.filter(
-                shelf=self.read_shelf,
-                edition=self.hardcover_edition
-            ).exists()
-        )
-        
-        self.assertTrue(
-            ShelfEdition.objects.filter(
-                shelf=self.owned_shelf,
-                edition=self.hardcover_edition
-            ).exists()
-        )
+        self.assertEqual(self._shelf_ids_holding(self.hardcover_edition), {self.read_shelf.pk})
+        self.assertEqual(self._shelf_ids_holding(self.paperback_edition), {self.read_shelf.pk})
+        self.assertEqual(self._userbook_rows(), [{"read_status": "Read", "is_owned": False}])
     
     ## UserBook Removal
     
     # Removing edition from only status shelf deletes UserBook (valid)
     def test_removing_from_only_status_shelf_deletes_userbook(self):
         """Test removing edition from its only status shelf deletes UserBook"""
-        # Add edition to Read shelf
-        self.client.post(
-            self.add_to_read_url,
-            {"edition_id": self.hardcover_edition.pk},
-            format="json"
-        )
-        
-        # Verify UserBook exists
-        self.assertTrue(UserBook.objects.filter(user=self.user, book=self.book).exists())
+        # Start with the edition on the Read shelf
+        self._seed_shelf(self.read_shelf, self.hardcover_edition, read_status="Read")
         
         # Remove from Read shelf
         remove_url = f"{self.remove_from_read_url}?edition_id={self.hardcover_edition.pk}"
-        response = self.client.delete(remove_url)
+        with self.assertNumQueries(9):
+            response = self.client.delete(remove_url)
         
         # Verify success and UserBook deletion
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
-        self.assertFalse(UserBook.objects.filter(user=self.user, book=self.book).exists())
+        self.assertEqual(self._userbook_rows(), [])
     
-    # Removing edition from status shelf but still owned keeps UserBook (valid)
-    def test_removing_from_status_shelf_but_still_owned_keeps_userbook(self):
-        """Test removing edition from status shelf but still owned keeps UserBook"""
-        # Add edition to Read and Owned shelves
-        self.client.post(
-            self.add_to_read_url,
-            {"edition_id": self.hardcover_edition.pk},
-            format="json"
-        )
-        
-        self.client.post(
-            self.add_to_owned_url,
-            {"edition_id": self.hardcover_edition.pk},
-            format="json"
-        )
-        
-        # Verify initial UserBook state
-        user_book = UserBook.objects.get(user=self.user, book=self.book)
-        self.assertEqual(user_book.read_status, "Read")
-        self.assertTrue(user_book.is_owned)
-        
-        # Remove from Read shelf
-        remove_url = f"{self.remove_from_read_url}?edition_id={self.hardcover_edition.pk}"
-        response = self.client.delete(remove_url)
-        
-        # Verify success
-        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
-        
-        # Verify UserBook still exists but with updated properties
-        self.assertTrue(UserBook.objects.filter(user=self.user, book=self.book).exists())
-        
-        user_book.refresh_from_db()
-        self.assertTrue(user_book.is_owned)
-        # Depending on your implementation, read_status might be cleared or maintain previous value
-    
-    # Removing edition from owned shelf but still in status keeps UserBook (valid)
-    def test_removing_from_owned_shelf_but_still_in_status_keeps_userbook(self):
-        """Test removing edition from owned shelf but still in status keeps UserBook"""
-        # Add edition to Read and Owned shelves
-        self.client.post(
-            self.add_to_read_url,
-            {"edition_id": self.hardcover_edition.pk},
-            format="json"
-        )
-        
-        self.client.post(
-            self.add_to_owned_url,
-            {"edition_id": self.hardcover_edition.pk},
-            format="json"
-        )
-        
-        # Verify initial UserBook state
-        user_book = UserBook.objects.get(user=self.user, book=self.book)
-        self.assertEqual(user_book.read_status, "Read")
-        self.assertTrue(user_book.is_owned)
-        
-        # Remove from Owned shelf
-        remove_url = f"{self.remove_from_owned_url}?edition_id={self.hardcover_edition.pk}"
-        response = self.client.delete(remove_url)
-        
-        # Verify success
-        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
-        
-        # Verify UserBook still exists but with updated properties
-        self.assertTrue(UserBook.objects.filter(user=self.user, book=self.book).exists())
-        
-        user_book.refresh_from_db()
-        self.assertEqual(user_book.read_status, "Read")
-        self.assertFalse(user_book.is_owned)
+    # Adding to and removing from status and Owned shelves tracks both properties (valid)
+    def test_status_and_owned_combinations(self):
+        """
+        Test that UserBook read_status and is_owned follow each combination of
+        status and Owned shelf operations. Each case runs in its own rolled
+        back savepoint so the cases share one test's fixture setup.
+        """
+        read_url = f"{self.remove_from_read_url}?edition_id={self.hardcover_edition.pk}"
+        owned_url = f"{self.remove_from_owned_url}?edition_id={self.hardcover_edition.pk}"
+        
+        # (description, seeded (shelf, status, owned) steps, method, url,
+        #  expected status code, expected UserBook row, expected shelves, queries)
+        cases = [
+            (
+                "add to Owned sets is_owned",
+                [],
+                "post", self.add_to_owned_url, status.HTTP_201_CREATED,
+                {"read_status": None, "is_owned": True}, {self.owned_shelf.pk}, 6,
+            ),
+            (
+                "add to Owned keeps the Read status",
+                [(self.read_shelf, "Read", False)],
+                "post", self.add_to_owned_url, status.HTTP_201_CREATED,
+                {"read_status": "Read", "is_owned": True}, {self.read_shelf.pk, self.owned_shelf.pk}, 6,
+            ),
+            (
+                "remove from Read keeps an owned UserBook",
+                [(self.read_shelf, "Read", False), (self.owned_shelf, "Read", True)],
+                "delete", read_url, status.HTTP_204_NO_CONTENT,
+                {"read_status": None, "is_owned": True}, {self.owned_shelf.pk}, 8,
+            ),
+            (
+                "remove from Owned keeps the Read status",
+                [(self.read_shelf, "Read", False), (self.owned_shelf, "Read", True)],
+                "delete", owned_url, status.HTTP_204_NO_CONTENT,
+                {"read_status": "Read", "is_owned": False}, {self.read_shelf.pk}, 8,
+            ),
+        ]
+        
+        for description, seeds, method, url, expected_status, expected_row, expected_shelves, num_queries in cases:
+            with self.subTest(description), transaction.atomic():
+                for shelf, read_status, owned in seeds:
+                    self._seed_shelf(shelf, self.hardcover_edition, read_status=read_status, owned=owned)
+                
+                with self.assertNumQueries(num_queries):
+                    if method == "post":
+                        response = self.client.post(url, self.hardcover_body, content_type="application/json")
+                    else:
+                        response = self.client.delete(url)
+                
+                self.assertEqual(response.status_code, expected_status)
+                self.assertEqual(self._userbook_rows(), [expected_row])
+                self.assertEqual(self._shelf_ids_holding(self.hardcover_edition), expected_shelves)
+                
+                # Undo this case before the next one runs
+                transaction.set_rollback(True)
     
     # Removing same book's different edition updates same UserBook (valid)
     def test_removing_different_edition_of_same_book_updates_userbook(self):
         """Test removing different edition of same book updates the same UserBook"""
-        # Add both editions to different shelves
-        self.client.post(
-            self.add_to_reading_url,
-            {"edition_id": self.hardcover_edition.pk},
-            format="json"
-        )
-        
-        self.client.post(
-            self.add_to_owned_url,
-            {"edition_id": self.paperback_edition.pk},
-            format="json"
-        )
-        
-        # Verify initial UserBook state
-        user_book = UserBook.objects.get(user=self.user, book=self.book)
-        self.assertEqual(user_book.read_status, "Reading")
-        self.assertTrue(user_book.is_owned)
+        # Start with both editions on different shelves
+        self._seed_shelf(self.reading_shelf, self.hardcover_edition, read_status="Reading")
+        self._seed_shelf(self.owned_shelf, self.paperback_edition, read_status="Reading", owned=True)
         
         # Remove hardcover from Reading shelf
         remove_url = f"{self.remove_from_reading_url}?edition_id={self.hardcover_edition.pk}"
-        response = self.client.delete(remove_url)
+        with self.assertNumQueries(8):
+            response = self.client.delete(remove_url)
         
         # Verify success
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         
         # Verify UserBook still exists but with updated properties
-        self.assertTrue(UserBook.objects.filter(user=self.user, book=self.book).exists())
-        
-        user_book.refresh_from_db()
-        self.assertTrue(user_book.is_owned)
+        rows = self._userbook_rows()
+        self.assertEqual(len(rows), 1)
+        self.assertTrue(rows[0]["is_owned"])
         # read_status should be removed or set to a default value
+    
+    # Removing from a status shelf falls back to the highest precedence remaining status (valid)
+    def test_removing_falls_back_to_highest_precedence_status(self):
+        """Test removing edition picks Reading over Want to Read when both remain"""
+        # Start with the book on three status shelves, the oldest being Want to Read
+        self._seed_shelf(self.want_to_read_shelf, self.paperback_edition, read_status="Want to Read")
+        self._seed_shelf(self.reading_shelf, self.paperback_edition, read_status="Reading")
+        self._seed_shelf(self.read_shelf, self.hardcover_edition, read_status="Read")
+        
+        # Remove hardcover from Read shelf
+        remove_url = f"{self.remove_from_read_url}?edition_id={self.hardcover_edition.pk}"
+        with self.assertNumQueries(8):
+            response = self.client.delete(remove_url)
+        
+        # Verify the UserBook adopts Reading regardless of shelf placement order
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self._userbook_rows(), [{"read_status": "Reading", "is_owned": False}])
 
 ### Equivalent Classes ###
 ##  Radio Button Behavior ##
@@ -2277,200 +2298,107 @@ class UserBookEntityTests(TestCase):
 #       UserBook maintains status when removing from owned shelf                 (valid)
 #       UserBook deleted when removed from all special shelves                   (valid)
 
-class ShelfReadStatusTests(TestCase):
+class ShelfReadStatusTests(BaseUserBookFixtures):
     """
     Test Module for verifying read status "radio button" behavior of shelves
     """
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Create test (mock) data for read status tests.
-        Test user, books, editions, shelves and API client for testing.
+        Create test (mock) data once for the read status tests.
+        Test user, shelves and URLs on top of the shared book graph.
         """
-        # Create a test user
-        self.user = User.objects.create_user(
+        super().setUpTestData()
+
+        # Create a test user. These tests only use force_authenticate, so the
+        # user gets an unusable password and no hasher runs at all
+        cls.user = User.objects.create_user(
             username="reader_user",
-            email="reader@example.com",
-            password="testpassword"
-        )
-        
-        # Create reading status shelves
-        self.read_shelf = Shelf.objects.create(
-            user=self.user,
-            name="Read Books",
-            shelf_type="Read",
-            is_private=False
-        )
-        
-        self.reading_shelf = Shelf.objects.create(
-            user=self.user,
-            name="Currently Reading",
-            shelf_type="Reading",
-            is_private=False
-        )
-        
-        self.want_to_read_shelf = Shelf.objects.create(
-            user=self.user,
-            name="Want to Read",
-            shelf_type="Want to Read",
-            is_private=False
-        )
+            email="reader@example.com"
+        )
+        
+        # Create reading status, Owned and Custom shelves in a single INSERT
+        (
+            cls.read_shelf,
+            cls.reading_shelf,
+            cls.want_to_read_shelf,
+            cls.owned_shelf,
+            cls.custom_shelf,
+        ) = Shelf.objects.bulk_create([
+            Shelf(user=cls.user, name="Read Books", shelf_type="Read", is_private=False),
+            Shelf(user=cls.user, name="Currently Reading", shelf_type="Reading", is_private=False),
+            Shelf(user=cls.user, name="Want to Read", shelf_type="Want to Read", is_private=False),
+            Shelf(user=cls.user, name="Owned Books", shelf_type="Owned", is_private=False),
+            Shelf(user=cls.user, name="Custom Shelf", shelf_type="Custom", is_private=False),
+        ])
+        
+        cls._resolve_shelf_urls()
 
-        self.owned_shelf = Shelf.objects.create(
-            user=self.user,
-            name="Owned Books",
-            shelf_type="Owned",
-            is_private=False
-        )
-        
-        self.custom_shelf = Shelf.objects.create(
-            user=self.user,
-            name="Custom Shelf",
-            shelf_type="Custom",
-            is_private=False
-        )
-        
-        # Create book and editions
-        self.book = Book.objects.create(
-            title="Test Book",
-            book_id="test123"
-        )
-        
-        self.publisher = Publisher.objects.create(name="Test Publisher")
-        
-        self.hardcover_edition = Edition.objects.create(
-            book=self.book,
-            isbn="9781234567890",
-            publisher=self.publisher,
-            kind="Hardcover",
-            publication_year=2020,
-            language="English"
-        )
-        
-        self.paperback_edition = Edition.objects.create(
-            book=self.book,
-            isbn="9780987654321",
-            publisher=self.publisher,
-            kind="Paperback",
-            publication_year=2021,
-            language="English"
-        )
-        
-        # Create a second book and edition for additional tests
-        self.book2 = Book.objects.create(
-            title="Second Test Book",
-            book_id="test456"
-        )
-        
-        self.book2_edition = Edition.objects.create(
-            book=self.book2,
-            isbn="9781122334455",
-            publisher=self.publisher,
-            kind="Hardcover",
-            publication_year=2022,
-            language="English"
-        )
-        
-        # Set up API client
-        self.client = APIClient()
+    def setUp(self):
+        """
+        Authenticate the per-test API client as the test user.
+        """
         self.client.force_authenticate(user=self.user)
-        
-        # Set up URLs for adding editions to shelves
-        self.add_to_read_url = reverse("shelf-add-edition", kwargs={"pk": self.read_shelf.pk})
-        self.add_to_reading_url = reverse("shelf-add-edition", kwargs={"pk": self.reading_shelf.pk})
-        self.add_to_want_url = reverse("shelf-add-edition", kwargs={"pk": self.want_to_read_shelf.pk})
-        self.add_to_owned_url = reverse("shelf-add-edition", kwargs={"pk": self.owned_shelf.pk})
-        self.add_to_custom_url = reverse("shelf-add-edition", kwargs={"pk": self.custom_shelf.pk})
-        
-        # Set up URLs for removing editions from shelves
-        self.remove_from_read_url = reverse("shelf-remove-edition", kwargs={"pk": self.read_shelf.pk})
-        self.remove_from_reading_url = reverse("shelf-remove-edition", kwargs={"pk": self.reading_shelf.pk})
-        self.remove_from_want_url = reverse("shelf-remove-edition", kwargs={"pk": self.want_to_read_shelf.pk})
-        self.remove_from_owned_url = reverse("shelf-remove-edition", kwargs={"pk": self.owned_shelf.pk})
-        self.remove_from_custom_url = reverse("shelf-remove-edition", kwargs={"pk": self.custom_shelf.pk})
     
     ## Radio Button Behavior
     
     # Adding edition to status shelf when no prior status exists (valid)
     def test_add_edition_to_status_shelf_no_prior(self):
-        """Test adding an edition to a status shelf when it's not on any status shelf"""
-        # Add to "Want to Read" shelf
-        response = self.client.post(
-            self.add_to_want_url, 
-            {"edition_id": self.hardcover_edition.pk}, 
-            format="json"
-        )
-        
-        # Check response and shelf contains edition
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertTrue(
-            ShelfEdition.objects.filter(
-                shelf=self.want_to_read_shelf,
-                edition=self.hardcover_edition
-            ).exists()
-        )
-        
-        # Check UserBook created with correct status
-        self.assertTrue(
-            UserBook.objects.filter(
-                user=self.user,
-                book=self.book,
-                read_status="Want to Read"
-            ).exists()
-        )
+        """
+        Test adding an edition to each status shelf when it's not on any status
+        shelf. Each shelf runs in its own rolled back savepoint.
+        """
+        cases = [
+            (self.add_to_want_url, self.want_to_read_shelf, "Want to Read"),
+            (self.add_to_reading_url, self.reading_shelf, "Reading"),
+            (self.add_to_read_url, self.read_shelf, "Read"),
+        ]
+        
+        for url, shelf, read_status in cases:
+            with self.subTest(status=read_status), transaction.atomic():
+                response = self.client.post(url, self.hardcover_body, content_type="application/json")
+                
+                # Check response and only this shelf contains the edition
+                self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+                self.assertEqual(self._shelf_ids_holding(self.hardcover_edition), {shelf.pk})
+                
+                # Check UserBook created with correct status
+                self.assertEqual(self._userbook_rows(), [{"read_status": read_status, "is_owned": False}])
+                
+                # Undo this case before the next one runs
+                transaction.set_rollback(True)
     
     # Adding edition to status shelf when it's on another status shelf (valid - should migrate)
     def test_add_edition_migrate_between_status_shelves(self):
         """Test that adding an edition to one status shelf removes it from another status shelf"""
-        # First add to "Want to Read" shelf
-        self.client.post(
-            self.add_to_want_url, 
-            {"edition_id": self.hardcover_edition.pk}, 
-            format="json"
-        )
+        # Start with the edition on the "Want to Read" shelf
+        self._seed_shelf(self.want_to_read_shelf, self.hardcover_edition, read_status="Want to Read")
         
         # Then add to "Reading" shelf
         response = self.client.post(
             self.add_to_reading_url, 
-            {"edition_id": self.hardcover_edition.pk}, 
-            format="json"
+            self.hardcover_body,
+            content_type="application/json"
         )
         
-        # Check response and "Reading" shelf contains edition
+        # Check response and edition moved off "Want to Read" onto "Reading"
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertTrue(
-            ShelfEdition.objects.filter(
-                shelf=self.reading_shelf,
-                edition=self.hardcover_edition
-            ).exists()
-        )
-        
-        # Check "Want to Read" shelf no longer contains edition
-        self.assertFalse(
-            ShelfEdition.objects.filter(
-                shelf=self.want_to_read_shelf,
-                edition=self.hardcover_edition
-            ).exists()
-        )
+        self.assertEqual(self._shelf_ids_holding(self.hardcover_edition), {self.reading_shelf.pk})
         
         # Check UserBook updated with new status
-        user_book = UserBook.objects.get(user=self.user, book=self.book)
-        self.assertEqual(user_book.read_status, "Reading")
+        self.assertEqual(self._userbook_rows(), [{"read_status": "Reading", "is_owned": False}])
     
     # Adding edition to status shelf when it's on same status shelf (invalid)
     def test_add_edition_to_same_status_shelf(self):
         """Test attempting to add an edition to a shelf it's already on"""
-        # Add to "Read" shelf
-        self.client.post(
-            self.add_to_read_url, 
-            {"edition_id": self.hardcover_edition.pk}, 
-            format="json"
-        )
+        # Start with the edition on the "Read" shelf
+        self._seed_shelf(self.read_shelf, self.hardcover_edition, read_status="Read")
         
         # Try to add again to same shelf
         response = self.client.post(
             self.add_to_read_url, 
-            {"edition_id": self.hardcover_edition.pk}, 
-            format="json"
+            self.hardcover_body,
+            content_type="application/json"
         )
         
         # Should fail with 400 Bad Request
@@ -2479,209 +2407,128 @@ class ShelfReadStatusTests(TestCase):
     # Adding edition to owned shelf doesn't affect status shelf (valid)
     def test_add_to_owned_keeps_status(self):
         """Test adding an edition to Owned shelf doesn't remove it from status shelves"""
-        # First add to "Reading" shelf
-        self.client.post(
-            self.add_to_reading_url, 
-            {"edition_id": self.hardcover_edition.pk}, 
-            format="json"
-        )
+        # Start with the edition on the "Reading" shelf
+        self._seed_shelf(self.reading_shelf, self.hardcover_edition, read_status="Reading")
         
         # Then add to "Owned" shelf
         response = self.client.post(
             self.add_to_owned_url, 
-            {"edition_id": self.hardcover_edition.pk}, 
-            format="json"
+            self.hardcover_body,
+            content_type="application/json"
         )
         
         # Check response and both shelves contain edition
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertTrue(
-            ShelfEdition.objects.filter(
-                shelf=self.reading_shelf,
-                edition=self.hardcover_edition
-            ).exists()
-        )
-        self.assertTrue(
-            ShelfEdition.objects.filter(
-                shelf=self.owned_shelf,
-                edition=self.hardcover_edition
-            ).exists()
+        self.assertEqual(
+            self._shelf_ids_holding(self.hardcover_edition),
+            {self.reading_shelf.pk, self.owned_shelf.pk}
         )
         
         # Check UserBook has both statuses
-        user_book = UserBook.objects.get(user=self.user, book=self.book)
-        self.assertEqual(user_book.read_status, "Reading")
-        self.assertTrue(user_book.is_owned)
+        self.assertEqual(self._userbook_rows(), [{"read_status": "Reading", "is_owned": True}])
     
     # Adding edition to status shelf doesn't affect owned shelf (valid)
     def test_add_to_status_keeps_owned(self):
         """Test adding an edition to a status shelf doesn't remove it from Owned shelf"""
-        # First add to "Owned" shelf
-        self.client.post(
-            self.add_to_owned_url, 
-            {"edition_id": self.hardcover_edition.pk}, 
-            format="json"
-        )
+        # Start with the edition on the "Owned" shelf
+        self._seed_shelf(self.owned_shelf, self.hardcover_edition, owned=True)
         
         # Then add to "Read" shelf
         response = self.client.post(
             self.add_to_read_url, 
-            {"edition_id": self.hardcover_edition.pk}, 
-            format="json"
+            self.hardcover_body,
+            content_type="application/json"
         )
         
         # Check response and both shelves contain edition
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertTrue(
-            ShelfEdition.objects.filter(
-                shelf=self.owned_shelf,
-                edition=self.hardcover_edition
-            ).exists()
-        )
-        self.assertTrue(
-            ShelfEdition.objects.filter(
-                shelf=self.read_shelf,
-                edition=self.hardcover_edition
-            ).exists()
+        self.assertEqual(
+            self._shelf_ids_holding(self.hardcover_edition),
+            {self.owned_shelf.pk, self.read_shelf.pk}
         )
         
         # Check UserBook has both statuses
-        user_book = UserBook.objects.get(user=self.user, book=self.book)
-        self.assertEqual(user_book.read_status, "Read")
-        self.assertTrue(user_book.is_owned)
+        self.assertEqual(self._userbook_rows(), [{"read_status": "Read", "is_owned": True}])
     
     ## Different Editions Same Book
     
     # Adding different edition of same book to different status shelf (valid - should migrate)
     def test_different_editions_same_book_migrate(self):
         """Test that adding a different edition of the same book to another status shelf migrates correctly"""
-        # Add hardcover to "Want to Read" shelf
-        self.client.post(
-            self.add_to_want_url, 
-            {"edition_id": self.hardcover_edition.pk}, 
-            format="json"
-        )
+        # Start with the hardcover on the "Want to Read" shelf
+        self._seed_shelf(self.want_to_read_shelf, self.hardcover_edition, read_status="Want to Read")
         
         # Add paperback to "Reading" shelf (same book, different edition)
         response = self.client.post(
             self.add_to_reading_url, 
-            {"edition_id": self.paperback_edition.pk}, 
-            format="json"
+            self.paperback_body,
+            content_type="application/json"
         )
         
-        # Check response and paperback is on "Reading" shelf
+        # Check response, and that the paperback on "Reading" is now the only
+        # placement of the book (the hardcover left "Want to Read")
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertTrue(
+        placements = set(
             ShelfEdition.objects.filter(
-                shelf=self.reading_shelf,
-                edition=self.paperback_edition
-            ).exists()
-        )
-        
-        # Check hardcover is no longer on "Want to Read" shelf
-        self.assertFalse(
-            ShelfEdition.objects.filter(
-                shelf=self.want_to_read_shelf,
-                edition=self.hardcover_edition
-            ).exists()
+                shelf__user=self.user,
+                edition__book=self.book
+            ).values_list("shelf_id", "edition_id")
         )
+        self.assertEqual(placements, {(self.reading_shelf.pk, self.paperback_edition.pk)})
         
         # Check UserBook has updated status
-        user_book = UserBook.objects.get(user=self.user, book=self.book)
-        self.assertEqual(user_book.read_status, "Reading")
+        self.assertEqual(self._userbook_rows(), [{"read_status": "Reading", "is_owned": False}])
     
     ## UserBook Updates
     
-    # UserBook created when adding to first special shelf (valid)
-    def test_userbook_created_when_adding_to_special_shelf(self):
-        """Test that UserBook is created when adding an edition to a special shelf"""
-        # First verify no UserBook exists
-        self.assertFalse(
-            UserBook.objects.filter(
-                user=self.user,
-                book=self.book
-            ).exists()
-        )
-        
-        # Add to "Read" shelf
-        self.client.post(
-            self.add_to_read_url, 
-            {"edition_id": self.hardcover_edition.pk}, 
-            format="json"
-        )
-        
-        # Verify UserBook was created with correct status
-        self.assertTrue(
-            UserBook.objects.filter(
-                user=self.user,
-                book=self.book,
-                read_status="Read"
-            ).exists()
-        )
-    
     # UserBook updated when moving between status shelves (valid)
     def test_userbook_updated_when_moving_between_status_shelves(self):
         """Test that UserBook is updated when edition moves between status shelves"""
         # Add to "Want to Read" shelf
         self.client.post(
             self.add_to_want_url, 
-            {"edition_id": self.hardcover_edition.pk}, 
-            format="json"
+            self.hardcover_body,
+            content_type="application/json"
         )
         
         # Verify initial UserBook status
-        user_book = UserBook.objects.get(user=self.user, book=self.book)
-        self.assertEqual(user_book.read_status, "Want to Read")
+        self.assertEqual(self._userbook_rows(), [{"read_status": "Want to Read", "is_owned": False}])
         
         # Move to "Reading" shelf
         self.client.post(
             self.add_to_reading_url, 
-            {"edition_id": self.hardcover_edition.pk}, 
-            format="json"
+            self.hardcover_body,
+            content_type="application/json"
         )
         
         # Verify UserBook status updated
-        user_book.refresh_from_db()
-        self.assertEqual(user_book.read_status, "Reading")
+        self.assertEqual(self._userbook_rows(), [{"read_status": "Reading", "is_owned": False}])
         
         # Move to "Read" shelf
         self.client.post(
             self.add_to_read_url, 
-            {"edition_id": self.hardcover_edition.pk}, 
-            format="json"
+            self.hardcover_body,
+            content_type="application/json"
         )
         
         # Verify UserBook status updated again
-        user_book.refresh_from_db()
-        self.assertEqual(user_book.read_status, "Read")
+        self.assertEqual(self._userbook_rows(), [{"read_status": "Read", "is_owned": False}])
     
     # UserBook maintains owned status when removing from status shelf (valid)
     def test_userbook_maintains_owned_status_when_removing_from_status(self):
         """Test that UserBook maintains owned status when removed from status shelf"""
-        # Add to both "Owned" and "Reading" shelves
-        self.client.post(
-            self.add_to_owned_url, 
-            {"edition_id": self.hardcover_edition.pk}, 
-            format="json"
-        )
-        self.client.post(
-            self.add_to_reading_url, 
-            {"edition_id": self.hardcover_edition.pk}, 
-            format="json"
-        )
-        
-        # Verify initial UserBook status
-        user_book = UserBook.objects.get(user=self.user, book=self.book)
-        self.assertEqual(user_book.read_status, "Reading")
-        self.assertTrue(user_book.is_owned)
+        # Start with the edition on both the "Owned" and "Reading" shelves
+        self._seed_shelf(self.owned_shelf, self.hardcover_edition, owned=True)
+        self._seed_shelf(self.reading_shelf, self.hardcover_edition, read_status="Reading", owned=True)
         
         # Remove from "Reading" shelf
         remove_url = f"{self.remove_from_reading_url}?edition_id={self.hardcover_edition.pk}"
         self.client.delete(remove_url)
         
         # Verify UserBook kept "is_owned" but lost read_status
-        user_book.refresh_from_db()
-        self.assertTrue(user_book.is_owned)
+        rows = self._userbook_rows()
+        self.assertEqual(len(rows), 1)
+        self.assertTrue(rows[0]["is_owned"])
         
         # Note: The exact behavior for read_status after removal depends on implementation
         # It might retain the previous value or be set to None/empty
@@ -2689,41 +2536,22 @@ class ShelfReadStatusTests(TestCase):
     # UserBook maintains status when removing from owned shelf (valid)
     def test_userbook_maintains_status_when_removing_from_owned(self):
         """Test that UserBook maintains status when removed from owned shelf"""
-        # Add to both "Owned" and "Read" shelves
-        self.client.post(
-            self.add_to_owned_url, 
-            {"edition_id": self.hardcover_edition.pk}, 
-            format="json"
-        )
-        self.client.post(
-            self.add_to_read_url, 
-            {"edition_id": self.hardcover_edition.pk}, 
-            format="json"
-        )
-        
-        # Verify initial UserBook status
-        user_book = UserBook.objects.get(user=self.user, book=self.book)
-        self.assertEqual(user_book.read_status, "Read")
-        self.assertTrue(user_book.is_owned)
+        # Start with the edition on both the "Owned" and "Read" shelves
+        self._seed_shelf(self.owned_shelf, self.hardcover_edition, owned=True)
+        self._seed_shelf(self.read_shelf, self.hardcover_edition, read_status="Read", owned=True)
         
         # Remove from "Owned" shelf
         remove_url = f"{self.remove_from_owned_url}?edition_id={self.hardcover_edition.pk}"
         self.client.delete(remove_url)
         
         # Verify UserBook kept read_status but lost is_owned
-        user_book.refresh_from_db()
-        self.assertEqual(user_book.read_status, "Read")
-        self.assertFalse(user_book.is_owned)
+        self.assertEqual(self._userbook_rows(), [{"read_status": "Read", "is_owned": False}])
     
     # UserBook deleted when removed from all special shelves (valid)
     def test_userbook_deleted_when_removed_from_all_special_shelves(self):
         """Test that UserBook is deleted when removed from all special shelves"""
-        # Add to "Read" shelf
-        self.client.post(
-            self.add_to_read_url, 
-            {"edition_id": self.hardcover_edition.pk}, 
-            format="json"
-        )
+        # Start with the edition on the "Read" shelf
+        self._seed_shelf(self.read_shelf, self.hardcover_edition, read_status="Read")
         
         # Verify UserBook exists
         self.assertTrue(
@@ -2748,26 +2576,32 @@ class ShelfReadStatusTests(TestCase):
     # UserBook not affected by custom shelves (valid)
     def test_userbook_not_affected_by_custom_shelves(self):
         """Test that adding/removing from custom shelves doesn't affect UserBook status"""
-        # Add to "Read" shelf and "Custom" shelf
-        self.client.post(
-            self.add_to_read_url, 
-            {"edition_id": self.hardcover_edition.pk}, 
-            format="json"
-        )
-        self.client.post(
-            self.add_to_custom_url, 
-            {"edition_id": self.hardcover_edition.pk}, 
-            format="json"
-        )
-        
-        # Verify UserBook has "Read" status
-        user_book = UserBook.objects.get(user=self.user, book=self.book)
-        self.assertEqual(user_book.read_status, "Read")
+        # Start with the edition on the "Read" and "Custom" shelves
+        self._seed_shelf(self.read_shelf, self.hardcover_edition, read_status="Read")
+        self._seed_shelf(self.custom_shelf, self.hardcover_edition, read_status="Read")
         
         # Remove from "Custom" shelf
         remove_url = f"{self.remove_from_custom_url}?edition_id={self.hardcover_edition.pk}"
         self.client.delete(remove_url)
         
         # Verify UserBook still exists with same status
-        user_book.refresh_from_db()
-        self.assertEqual(user_book.read_status, "Read")
\ No newline at end of file
+        self.assertEqual(self._userbook_rows(), [{"read_status": "Read", "is_owned": False}])
+
+
+class ShelfTestBaseClassTests(SimpleTestCase):
+    """
+    Guard that every database test class in this module stays on TestCase.
+
+    TestCase rolls each test back to a savepoint, while a plain
+    TransactionTestCase (or LiveServerTestCase) flushes every table after each
+    test, which is far slower for fixture-heavy classes like the UserBook ones.
+    """
+    databases = set()
+
+    def test_database_test_classes_use_test_case(self):
+        """Test that no class in this module falls back to TransactionTestCase"""
+        for obj in globals().values():
+            # Only check classes defined here, not the imported base classes
+            if isinstance(obj, type) and obj.__module__ == __name__ and issubclass(obj, TransactionTestCase):
+                with self.subTest(obj.__name__):
+                    self.assertTrue(issubclass(obj, TestCase))
\ No newline at end of file
@@ -3,16 +3,35 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.filters import SearchFilter
 from django_filters.rest_framework import DjangoFilterBackend
 from django.shortcuts import get_object_or_404
+from django.http import Http404
+from django.db.models import Case, When, Value, IntegerField
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from library.models import Shelf, ShelfEdition, Edition, UserBook
-from .serializers import ShelfSerializer, AddEditionToShelfSerializer, ShelfEditionSerializer
+from .serializers import (
+    ShelfSerializer, AddEditionToShelfSerializer, AddEditionsToShelfSerializer, ShelfEditionSerializer
+)
 from .permissions import IsShelfOwnerOrReadOnly
 
 User = get_user_model()
 
+# Shelf types that represent reading status (for radio button behavior)
+STATUS_SHELF_TYPES = frozenset({"Read", "Reading", "Want to Read"})
+# The UserBook field, and the value for it, each special shelf type sets
+# when an edition is added
+SHELF_TYPE_USERBOOK_FIELD = {
+    "Read": ("read_status", "Read"),
+    "Reading": ("read_status", "Reading"),
+    "Want to Read": ("read_status", "Want to Read"),
+    "Owned": ("is_owned", True),
+    "Favorites": ("is_favorite", True),
+}
+# Shelf types whose UserBook field is synced when an edition is removed
+REMOVE_SYNCED_SHELF_TYPES = STATUS_SHELF_TYPES | {"Owned"}
+
 class ShelfViewSet(viewsets.ModelViewSet):
     """
     Extend Django's built in Model ViewSet for shelf management.
@@ -27,6 +46,7 @@ class ShelfViewSet(viewsets.ModelViewSet):
     
     Additional custom actions:
     - add_edition (POST): Add an edition to a shelf
+    - add_editions (POST): Add several editions to a shelf at once
     - remove_edition (DELETE): Remove an edition from a shelf
     - editions (GET): List all editions on a shelf
     
@@ -61,9 +81,12 @@ class ShelfViewSet(viewsets.ModelViewSet):
             # Same user - public + private
             return Shelf.objects.filter(user=user)
         else:
-            # Another user - only that user's public shelves
-            target_user = get_object_or_404(User, username=username)
-            return Shelf.objects.filter(user=target_user, is_private=False)
+            # Another user - only that user's public shelves. Only the id is
+            # needed to filter on, so don't load the whole User row
+            target_user_id = User.objects.filter(username=username).values_list('id', flat=True).first()
+            if target_user_id is None:
+                raise Http404("No User matches the given query.")
+            return Shelf.objects.filter(user_id=target_user_id, is_private=False)
 
     def get_object(self):
         """
@@ -71,23 +94,42 @@ class ShelfViewSet(viewsets.ModelViewSet):
         
         We look up the Shelf by pk from ALL shelves. That way, if it's public (or 
         owned by the current user), it's found and the permission check decides 
-        whether to allow access.
+        whether to allow access. The owner is joined in up front since the
+        permission check compares against it.
+        
+        The shelf is kept on the view (a view instance serves one request), since
+        update, partial_update and destroy look it up before handing off to the
+        parent implementation, which looks it up again.
         """
-        obj = get_object_or_404(Shelf, pk=self.kwargs['pk'])
+        cached_shelf = getattr(self, '_shelf', None)
+        if cached_shelf is not None and str(cached_shelf.pk) == str(self.kwargs['pk']):
+            return cached_shelf
+        
+        obj = get_object_or_404(Shelf.objects.select_related('user'), pk=self.kwargs['pk'])
         self.check_object_permissions(self.request, obj)
+        self._shelf = obj
         return obj
 
+    def _check_custom(self, detail):
+        """
+        Return a 403 response if the requested shelf isn't a 'Custom' shelf,
+        otherwise None.
+        
+        The shelf comes from get_object, which keeps it on the view, so the
+        parent update/destroy that runs afterwards doesn't fetch it again.
+        """
+        if self.get_object().shelf_type != "Custom":
+            return Response({"detail": detail}, status=status.HTTP_403_FORBIDDEN)
+        return None
+
     def update(self, request, *args, **kwargs):
         """
         Full update (PUT): Only allowed if shelf's shelf_type == 'Custom'.
         Also disallow changing shelf_type away from 'Custom'.
         """
-        shelf = self.get_object()
-        if shelf.shelf_type != "Custom":
-            return Response(
-                {"detail": "Cannot update non-custom shelves."},
-                status=status.HTTP_403_FORBIDDEN
-            )
+        rejection = self._check_custom("Cannot update non-custom shelves.")
+        if rejection is not None:
+            return rejection
         return super().update(request, *args, **kwargs)
 
     def partial_update(self, request, *args, **kwargs):
@@ -95,12 +137,9 @@ class ShelfViewSet(viewsets.ModelViewSet):
         Partial update (PATCH): Only allowed if shelf's shelf_type == 'Custom'.
         Also disallow changing shelf_type away from 'Custom'.
         """
-        shelf = self.get_object()
-        if shelf.shelf_type != "Custom":
-            return Response(
-                {"detail": "Cannot update non-custom shelves."},
-                status=status.HTTP_403_FORBIDDEN
-            )
+        rejection = self._check_custom("Cannot update non-custom shelves.")
+        if rejection is not None:
+            return rejection
         return super().partial_update(request, *args, **kwargs)
 
     def perform_update(self, serializer):
@@ -125,15 +164,12 @@ class ShelfViewSet(viewsets.ModelViewSet):
         """
         Prevent deleting shelves that are not 'Custom'.
         """
-        shelf = self.get_object()
-        if shelf.shelf_type != "Custom":
-            return Response(
-                {"detail": "Cannot delete non-custom shelves."},
-                status=status.HTTP_403_FORBIDDEN
-            )
+        rejection = self._check_custom("Cannot delete non-custom shelves.")
+        if rejection is not None:
+            return rejection
         return super().destroy(request, *args, **kwargs)
     
-    def _update_userbook_after_add(self, shelf, edition):
+    def _update_userbook_after_add(self, shelf, book_id):
         """
         Update UserBook after adding an edition to a shelf.
         Also ensures proper "radio button" behavior for Read status shelves
@@ -141,74 +177,94 @@ class ShelfViewSet(viewsets.ModelViewSet):
         
         Args:
             shelf: The Shelf object the edition was added to
-            edition: The Edition object that was added
+            book_id: The id of the book whose edition was added
         """
-        # Define shelf types that represent reading status (for radio button behavior)
-        status_shelf_types = ["Read", "Reading", "Want to Read"]
+        self._update_userbooks_after_add(shelf, [book_id])
+
+    def _update_userbooks_after_add(self, shelf, book_ids):
+        """
+        Update the UserBooks for several books after adding their editions to
+        a shelf, in the same number of queries however many books there are.
+        Also ensures proper "radio button" behavior for Read status shelves
+        by removing the books' editions from any other status shelves.
         
+        Args:
+            shelf: The Shelf object the editions were added to
+            book_ids: The ids of the books whose editions were added
+        """
         # If adding to a reading status shelf, remove from other status shelves first
-        if shelf.shelf_type in status_shelf_types:
-            # Find all other shelves of this user with status types that contain this edition
-            other_status_shelves = ShelfEdition.objects.filter(
+        if shelf.shelf_type in STATUS_SHELF_TYPES:
+            # Remove these books' editions from all other status shelves of this user
+            ShelfEdition.objects.filter(
                 shelf__user=shelf.user,
-                shelf__shelf_type__in=status_shelf_types,
-                edition__book=edition.book
-            ).exclude(shelf=shelf)
-            
-            # Remove this edition from those shelves
-            for shelf_edition in other_status_shelves:
-                # Delete the relationship
-                shelf_edition.delete()
+                shelf__shelf_type__in=STATUS_SHELF_TYPES,
+                edition__book_id__in=book_ids
+            ).exclude(shelf=shelf).delete()
         
-        # Only handle special shelf types (Read, Reading, Want to Read, Owned)
-        special_shelf_types = ["Read", "Reading", "Want to Read", "Owned", "Favorites"]
+        # Only handle special shelf types (Read, Reading, Want to Read, Owned, Favorites)
+        userbook_field = SHELF_TYPE_USERBOOK_FIELD.get(shelf.shelf_type)
+        if userbook_field is None:
+            return
         
-        if shelf.shelf_type in special_shelf_types:
-            # Get or create a UserBook record
-            user_book, created = UserBook.objects.get_or_create(
-                user=shelf.user,
-                book=edition.book
-            )
-            
-            # If not created, update the fields
-            if shelf.shelf_type in ["Read", "Reading", "Want to Read"]:
-                user_book.read_status = shelf.shelf_type
-            
-            if shelf.shelf_type == "Owned":
-                user_book.is_owned = True
-            
-            if shelf.shelf_type == "Favorites":
-                user_book.is_favorite = True
-            
-            user_book.save()
+        field, value = userbook_field
+        
+        # Create the UserBook records or update just that field on them in a
+        # single INSERT ... ON CONFLICT DO UPDATE statement. Each book may only
+        # appear once, since Postgres can't update the same row twice in one go
+        UserBook.objects.bulk_create(
+            [
+                UserBook(user=shelf.user, book_id=book_id, **{field: value})
+                for book_id in sorted(set(book_ids))
+            ],
+            update_conflicts=True,
+            unique_fields=['user', 'book'],
+            update_fields=[field],
+            batch_size=500
+        )
 
-    def _update_userbook_after_remove(self, shelf, edition):
+    def _update_userbook_after_remove(self, shelf, book_id):
         """
         Update UserBook after removing an edition from a shelf.
         
         Args:
             shelf: The Shelf object the edition was removed from
-            edition: The Edition object that was removed
+            book_id: The id of the book whose edition was removed
         """
         # Only handle special shelf types (Read, Reading, Want to Read, Owned)
-        special_shelf_types = ["Read", "Reading", "Want to Read", "Owned"]
-        
-        if shelf.shelf_type in special_shelf_types:
+        if shelf.shelf_type in REMOVE_SYNCED_SHELF_TYPES:
             try:
                 # Try to get the UserBook
-                user_book = UserBook.objects.get(user=shelf.user, book=edition.book)
+                user_book = UserBook.objects.get(user=shelf.user, book_id=book_id)
+                
+                # Collect only the fields that change, to write them in one UPDATE
+                updates = {}
+                
+                # Find which special shelves still hold an edition of this book
+                # in one query, to answer both the ownership and the read status
+                # checks below. The database orders status shelves by which
+                # status wins (Reading, then Read, then Want to Read) ahead of
+                # Owned, so the first row is the status to fall back to
+                remaining_shelf_types = list(
+                    ShelfEdition.objects.filter(
+                        shelf__user=shelf.user,
+                        shelf__shelf_type__in=REMOVE_SYNCED_SHELF_TYPES,
+                        edition__book_id=book_id
+                    ).annotate(
+                        precedence=Case(
+                            When(shelf__shelf_type="Reading", then=Value(0)),
+                            When(shelf__shelf_type="Read", then=Value(1)),
+                            When(shelf__shelf_type="Want to Read", then=Value(2)),
+                            default=Value(9),
+                            output_field=IntegerField()
+                        )
+                    ).order_by('precedence', 'pk').values_list('shelf__shelf_type', flat=True)
+                )
                 
                 # Check if we need to update ownership
                 if shelf.shelf_type == "Owned":
                     # Check if there are any other editions of this book on Owned shelves
-                    other_owned_editions = ShelfEdition.objects.filter(
-                        shelf__user=shelf.user,
-                        shelf__shelf_type="Owned",
-                        edition__book=edition.book
-                    ).exists()
-                    
-                    if not other_owned_editions:
-                        user_book.is_owned = False
+                    if "Owned" not in remaining_shelf_types:
+                        updates["is_owned"] = False
 
                     # Check if we need to update favorites status
                     if shelf.shelf_type == "Favorites":
@@ -216,35 +272,34 @@ class ShelfViewSet(viewsets.ModelViewSet):
                         other_favorite_editions = ShelfEdition.objects.filter(
                             shelf__user=shelf.user,
                             shelf__shelf_type="Favorites",
-                            edition__book=edition.book
+                            edition__book_id=book_id
                         ).exists()
                         
                         if not other_favorite_editions:
-                            user_book.is_favorite = False
+                            updates["is_favorite"] = False
                 
                 # Check if we need to update read status
-                if shelf.shelf_type in ["Read", "Reading", "Want to Read"]:
+                if shelf.shelf_type in STATUS_SHELF_TYPES:
                     # Find if this book is on any other status shelves
-                    other_status_shelf = ShelfEdition.objects.filter(
-                        shelf__user=shelf.user,
-                        shelf__shelf_type__in=["Read", "Reading", "Want to Read"],
-                        edition__book=edition.book
-                    ).values_list('shelf__shelf_type', flat=True).first()
+                    other_status_shelf = None
+                    if remaining_shelf_types and remaining_shelf_types[0] in STATUS_SHELF_TYPES:
+                        other_status_shelf = remaining_shelf_types[0]
                     
                     if other_status_shelf:
                         # Update to the status of the other shelf
-                        user_book.read_status = other_status_shelf
+                        updates["read_status"] = other_status_shelf
                     else:
                         # If no other status shelf, set read_status to null
-                        user_book.read_status = None
+                        updates["read_status"] = None
                         
                         # If not owned either, delete the UserBook
                         if not user_book.is_owned and not user_book.is_favorite:
                             user_book.delete()
                             return
                 
-                # Save the updated UserBook
-                user_book.save()
+                # Save just the changed fields of the UserBook
+                if updates:
+                    UserBook.objects.filter(pk=user_book.pk).update(**updates)
                 
             except UserBook.DoesNotExist:
                 # No UserBook to update
@@ -259,7 +314,9 @@ class ShelfViewSet(viewsets.ModelViewSet):
         Method: POST
         Data: {"edition_id": id}
         
-        Returns the created ShelfEdition object or error if validation fails.
+        Returns the ids of the created ShelfEdition, its edition and shelf, or
+        error if validation fails. The full edition details are served by the
+        editions action.
         """
         shelf = self.get_object()
         
@@ -277,24 +334,75 @@ class ShelfViewSet(viewsets.ModelViewSet):
         )
         
         if serializer.is_valid():
-            # Create the shelf-edition relationship
-            shelf_edition = serializer.save()
-            
-            # Get the edition object
-            edition = Edition.objects.get(pk=shelf_edition.edition_id)
-            
-            # Update UserBook after adding edition
-            self._update_userbook_after_add(shelf, edition)
+            # Keep the shelf and UserBook writes in one transaction so a
+            # failure part way through can't leave them out of sync
+            with transaction.atomic():
+                # Create the shelf-edition relationship
+                shelf_edition = serializer.save()
+                
+                # Update UserBook after adding edition. The serializer already
+                # looked up the edition's book, so it isn't fetched again
+                self._update_userbook_after_add(shelf, serializer.validated_data['book_id'])
             
-            # Return the created ShelfEdition with complete details
-            return_serializer = ShelfEditionSerializer(shelf_edition)
+            # Return the created ShelfEdition's ids rather than re-serializing
+            # the edition, book, authors and covers on the write path
             return Response(
-                return_serializer.data,
+                {
+                    "id": shelf_edition.pk,
+                    "edition_id": shelf_edition.edition_id,
+                    "shelf_id": shelf_edition.shelf_id
+                },
                 status=status.HTTP_201_CREATED
             )
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
+    @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsShelfOwnerOrReadOnly])
+    def add_editions(self, request, pk=None):
+        """
+        Add several editions to this shelf at once.
+        
+        Path: /api/shelves/{shelf_id}/add_editions/
+        Method: POST
+        Data: {"edition_ids": [id, ...]}
+        
+        Editions already on the shelf are skipped. Returns the shelf id and the
+        requested edition ids, or error if validation fails.
+        """
+        shelf = self.get_object()
+        
+        # Only the shelf owner can add books
+        if request.user != shelf.user:
+            return Response(
+                {"detail": "Only the shelf owner can add books."},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        serializer = AddEditionsToShelfSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        edition_ids = serializer.validated_data['edition_ids']
+        
+        # Keep the shelf and UserBook writes in one transaction so a failure
+        # part way through can't leave them out of sync
+        with transaction.atomic():
+            # Create all the shelf-edition relationships in batched INSERTs,
+            # skipping editions that are already on this shelf
+            ShelfEdition.objects.bulk_create(
+                [ShelfEdition(shelf=shelf, edition_id=edition_id) for edition_id in edition_ids],
+                ignore_conflicts=True,
+                batch_size=500
+            )
+            
+            # Update the UserBooks for all the added books together
+            self._update_userbooks_after_add(shelf, serializer.validated_data['book_ids'])
+        
+        return Response(
+            {"shelf_id": shelf.pk, "edition_ids": edition_ids},
+            status=status.HTTP_201_CREATED
+        )
+    
     @action(detail=True, methods=['delete'], permission_classes=[IsAuthenticated, IsShelfOwnerOrReadOnly])
     def remove_edition(self, request, pk=None):
         """
@@ -322,21 +430,27 @@ class ShelfViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Get the ShelfEdition or return 404
-        shelf_edition = get_object_or_404(
-            ShelfEdition, 
-            shelf=shelf,
-            edition_id=edition_id
-        )
-        
-        # Get the edition object before deleting the relationship
-        edition = shelf_edition.edition
-        
-        # Delete the relationship
-        shelf_edition.delete()
-        
-        # Update UserBook after removing edition
-        self._update_userbook_after_remove(shelf, edition)
+        # Keep the shelf and UserBook writes in one transaction so a failure
+        # part way through can't leave them out of sync
+        with transaction.atomic():
+            # Delete the relationship in a single query, using the deleted row
+            # count to tell whether the edition was on the shelf at all
+            deleted, _ = ShelfEdition.objects.filter(
+                shelf=shelf,
+                edition_id=edition_id
+            ).delete()
+            
+            if not deleted:
+                return Response(
+                    {"detail": "Edition is not on this shelf."},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            
+            # Only the edition's book is needed to update the UserBook
+            book_id = Edition.objects.values_list('book_id', flat=True).get(pk=edition_id)
+            
+            # Update UserBook after removing edition
+            self._update_userbook_after_remove(shelf, book_id)
         
         return Response(status=status.HTTP_204_NO_CONTENT)
     
@@ -359,8 +473,23 @@ class ShelfViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        # Get all ShelfEdition objects for this shelf
-        shelf_editions = ShelfEdition.objects.filter(shelf=shelf)
+        # Get all ShelfEdition objects for this shelf, loading the edition, book,
+        # authors and cover images the serializer reads in a fixed number of
+        # queries, and only the edition and book columns it actually reads
+        shelf_editions = ShelfEdition.objects.filter(shelf=shelf).select_related(
+            'edition__book'
+        ).prefetch_related(
+            'edition__book__authors',
+            'edition__related_edition_image'
+        ).only(
+            'id',
+            'edition__id',
+            'edition__kind',
+            'edition__isbn',
+            'edition__publication_year',
+            'edition__book__id',
+            'edition__book__title'
+        )
         
         # Serialize the results
         serializer = ShelfEditionSerializer(shelf_editions, many=True)
@@ -1,3 +1,443 @@
 from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from library.models import Book, Edition, UserBook
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from rest_framework import status
 
-# Create your tests here.
+User = get_user_model()
+
+
+class BaseProgressFixtures(TestCase):
+    """
+    Shared fixtures for the reading progress tests: a user tracking two books,
+    and a third book they aren't tracking.
+    """
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Create test (mock) data once for the class.
+        """
+        cls.user = User.objects.create_user(
+            username="progress_reader",
+            email="progress_reader@example.com"
+        )
+
+        cls.book = Book.objects.create(title="Tracked Book", book_id="tracked-book")
+        cls.other_book = Book.objects.create(title="Other Tracked Book", book_id="other-tracked-book")
+        cls.untracked_book = Book.objects.create(title="Untracked Book", book_id="untracked-book")
+
+        # The paperback is the primary edition, so its page count is reported
+        cls.hardcover = Edition.objects.create(
+            book=cls.book, isbn="1111111111111", kind="Hardcover",
+            publication_year=2001, page_count=100
+        )
+        cls.paperback = Edition.objects.create(
+            book=cls.book, isbn="2222222222222", kind="Paperback",
+            publication_year=1999, page_count=300, is_primary=True
+        )
+
+        cls.user_book = UserBook.objects.create(
+            user=cls.user, book=cls.book, read_status="Reading", page_num=30
+        )
+        cls.other_user_book = UserBook.objects.create(
+            user=cls.user, book=cls.other_book, read_status="Reading", page_num=10
+        )
+
+    def setUp(self):
+        """
+        Authenticate the per-test API client as the test user.
+        """
+        self.client.force_authenticate(user=self.user)
+
+    def _page_nums(self):
+        """
+        Fetch the user's page_num per book_id in a single query.
+        """
+        return dict(
+            UserBook.objects.filter(user=self.user).values_list("book__book_id", "page_num")
+        )
+
+
+### Equivalent Classes for Bulk Progress Updates ###
+##  Tracked Books ##
+#       Every book is tracked           (valid)
+#       Some book is untracked          (invalid - nothing written)
+#       Some book does not exist        (invalid - nothing written)
+##  Request Body ##
+#       Non-empty list                  (valid)
+#       Not a list                      (invalid)
+##  Duplicates ##
+#       Same book_id twice              (valid - last page_num wins)
+##  Unchanged Pages ##
+#       page_num already matches        (valid - row not written)
+
+class BulkUpdateProgressTests(BaseProgressFixtures):
+    """
+    Test Module for updating progress for several books at once based on listed equivalence classes
+    """
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Additional setup for bulk update tests: URL resolved once per class
+        """
+        super().setUpTestData()
+        cls.url = reverse("bulk-update-book-progress")
+
+    # Tracked Books: Every book is tracked (valid)
+    def test_bulk_update_multiple_books(self):
+        """Test that every tracked book's page_num is updated in a fixed number of queries"""
+        data = [
+            {"book_id": self.book.book_id, "page_num": 45},
+            {"book_id": self.other_book.book_id, "page_num": 12},
+        ]
+
+        # One SELECT for the UserBooks, one UPDATE for both rows
+        with self.assertNumQueries(2):
+            response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["progress"], data)
+        self.assertEqual(
+            self._page_nums(),
+            {self.book.book_id: 45, self.other_book.book_id: 12}
+        )
+
+    # Tracked Books: Some book is untracked (invalid - nothing written)
+    def test_bulk_update_untracked_book(self):
+        """Test that one untracked book rejects the whole update"""
+        data = [
+            {"book_id": self.book.book_id, "page_num": 45},
+            {"book_id": self.untracked_book.book_id, "page_num": 12},
+        ]
+
+        response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("book_id", response.data)
+        self.assertEqual(
+            self._page_nums(),
+            {self.book.book_id: 30, self.other_book.book_id: 10}
+        )
+
+    # Tracked Books: Some book does not exist (invalid - nothing written)
+    def test_bulk_update_nonexistent_book(self):
+        """Test that a nonexistent book rejects the whole update"""
+        data = [
+            {"book_id": self.book.book_id, "page_num": 45},
+            {"book_id": "no-such-book", "page_num": 12},
+        ]
+
+        response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("book_id", response.data)
+        self.assertEqual(
+            self._page_nums(),
+            {self.book.book_id: 30, self.other_book.book_id: 10}
+        )
+
+    # Request Body: Not a list (invalid)
+    def test_bulk_update_non_list_body(self):
+        """Test that a single object instead of a list is rejected"""
+        response = self.client.post(
+            self.url, {"book_id": self.book.book_id, "page_num": 45}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self._page_nums()[self.book.book_id], 30)
+
+    # Duplicates: Same book_id twice (valid - last page_num wins)
+    def test_bulk_update_duplicate_book_ids(self):
+        """Test that a repeated book_id takes its last page_num"""
+        data = [
+            {"book_id": self.book.book_id, "page_num": 45},
+            {"book_id": self.book.book_id, "page_num": 50},
+        ]
+
+        response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["progress"], [{"book_id": self.book.book_id, "page_num": 50}])
+        self.assertEqual(self._page_nums()[self.book.book_id], 50)
+
+    # Unchanged Pages: page_num already matches (valid - row not written)
+    def test_bulk_update_skips_unchanged_rows(self):
+        """Test that books already on the sent page aren't written"""
+        data = [
+            {"book_id": self.book.book_id, "page_num": 30},
+            {"book_id": self.other_book.book_id, "page_num": 10},
+        ]
+
+        # Only the SELECT runs, since neither page changed
+        with self.assertNumQueries(1):
+            response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self._page_nums(),
+            {self.book.book_id: 30, self.other_book.book_id: 10}
+        )
+
+    # Unchanged Pages: page_num already matches (valid - row not written)
+    def test_bulk_update_writes_only_changed_rows(self):
+        """Test that only the books whose page changed are in the UPDATE"""
+        data = [
+            {"book_id": self.book.book_id, "page_num": 30},
+            {"book_id": self.other_book.book_id, "page_num": 11},
+        ]
+
+        with self.assertNumQueries(2) as captured:
+            response = self.client.post(self.url, data, format="json")
+
+        # The UPDATE only names the changed row
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        update_sql = captured.captured_queries[-1]["sql"]
+        self.assertIn(f"IN ({self.other_user_book.pk})", update_sql)
+        self.assertEqual(
+            self._page_nums(),
+            {self.book.book_id: 30, self.other_book.book_id: 11}
+        )
+
+### Equivalent Classes for Progress Authentication ###
+##  Token Owner ##
+#       Active user with a valid token      (valid)
+#       Deactivated user with a valid token (invalid)
+
+class ProgressAuthenticationTests(BaseProgressFixtures):
+    """
+    Test Module for authenticating progress requests with a real access token
+    based on listed equivalence classes
+    """
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Additional setup for authentication tests: URLs resolved once per class
+        """
+        super().setUpTestData()
+        cls.progress_url = reverse("get-book-progress", kwargs={"book_id": cls.book.book_id})
+        cls.update_url = reverse("update-book-progress")
+
+    def setUp(self):
+        """
+        Send the user's access token instead of forcing authentication, so
+        the configured authentication classes run.
+        """
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+
+    # Token Owner: Active user with a valid token (valid)
+    def test_active_user_token(self):
+        """Test that an active user's token can read their progress"""
+        response = self.client.get(self.progress_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    # Token Owner: Deactivated user with a valid token (invalid)
+    def test_deactivated_user_token(self):
+        """Test that a deactivated user's still-live token can't read or write progress"""
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        get_response = self.client.get(self.progress_url)
+        post_response = self.client.post(
+            self.update_url, {"book_id": self.book.book_id, "page_num": 99}, format="json"
+        )
+
+        self.assertEqual(get_response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(post_response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self._page_nums()[self.book.book_id], 30)
+
+### Equivalent Classes for Updating Progress ###
+##  Request Body ##
+#       Object with page_num                (valid)
+#       Not an object                       (invalid)
+##  Book Location ##
+#       book_id in the URL                  (valid)
+#       book_id in the data                 (valid)
+##  Page Change ##
+#       page_num differs from stored        (valid - row written)
+#       page_num matches stored             (valid - no write)
+
+class UpdateProgressTests(BaseProgressFixtures):
+    """
+    Test Module for updating a single book's progress based on listed equivalence classes
+    """
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Additional setup for update tests: URLs resolved once per class
+        """
+        super().setUpTestData()
+        cls.progress_url = reverse("get-book-progress", kwargs={"book_id": cls.book.book_id})
+        cls.update_url = reverse("update-book-progress")
+
+    # Request Body: Object with page_num (valid)
+    # Book Location: book_id in the URL (valid)
+    def test_update_with_book_id_in_url(self):
+        """Test updating progress through the book's progress URL"""
+        response = self.client.post(self.progress_url, {"page_num": 45}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["page_num"], 45)
+        self.assertEqual(response.data["total_pages"], 300)
+        self.assertEqual(self._page_nums()[self.book.book_id], 45)
+
+    # Request Body: Object with page_num (valid)
+    # Book Location: book_id in the data (valid)
+    def test_update_with_book_id_in_data(self):
+        """Test updating progress through update-progress/ with book_id in the data"""
+        response = self.client.post(
+            self.update_url, {"book_id": self.book.book_id, "page_num": 45}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._page_nums()[self.book.book_id], 45)
+
+    # Request Body: Not an object (invalid)
+    def test_update_with_non_object_body(self):
+        """Test that a list body is rejected with 400 rather than failing"""
+        for url in (self.progress_url, self.update_url):
+            with self.subTest(url=url):
+                response = self.client.post(url, [{"page_num": 45}], format="json")
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertEqual(self._page_nums()[self.book.book_id], 30)
+
+    # Page Change: page_num differs from stored (valid - row written)
+    def test_update_changed_page_writes(self):
+        """Test that a new page_num issues a single-column UPDATE"""
+        # One SELECT for the UserBook, one UPDATE
+        with self.assertNumQueries(2) as captured:
+            response = self.client.post(self.progress_url, {"page_num": 45}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        updates = [q["sql"] for q in captured.captured_queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('SET "page_num" = 45', updates[0])
+        self.assertEqual(self._page_nums()[self.book.book_id], 45)
+
+    # Page Change: page_num matches stored (valid - no write)
+    def test_update_unchanged_page_skips_write(self):
+        """Test that resending the stored page_num issues no UPDATE"""
+        # Only the SELECT runs
+        with self.assertNumQueries(1) as captured:
+            response = self.client.post(self.progress_url, {"page_num": 30}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["page_num"], 30)
+        self.assertFalse(
+            any(q["sql"].startswith("UPDATE") for q in captured.captured_queries)
+        )
+
+### Equivalent Classes for Total Pages ###
+##  Editions ##
+#       Primary edition present             (valid - primary's page count)
+#       Primary edition edited              (valid - new page count)
+#       Primary edition deleted             (valid - falls back to another edition)
+#       No editions                         (valid - no page count, 0%)
+
+class TotalPagesTests(BaseProgressFixtures):
+    """
+    Test Module for the total_pages reported with progress based on listed equivalence classes
+    """
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Additional setup for total pages tests: URL resolved once per class
+        """
+        super().setUpTestData()
+        cls.progress_url = reverse("get-book-progress", kwargs={"book_id": cls.book.book_id})
+
+    # Editions: Primary edition present (valid - primary's page count)
+    def test_total_pages_from_primary_edition(self):
+        """Test that the primary edition's page count is used, in a single query"""
+        with self.assertNumQueries(1):
+            response = self.client.get(self.progress_url)
+
+        self.assertEqual(response.data["total_pages"], 300)
+        self.assertEqual(response.data["progress_percentage"], 10)
+
+    # Editions: Primary edition edited (valid - new page count)
+    def test_total_pages_after_edition_edit(self):
+        """Test that editing the primary edition shows on the next read"""
+        self.assertEqual(self.client.get(self.progress_url).data["total_pages"], 300)
+
+        self.paperback.page_count = 600
+        self.paperback.save()
+
+        self.assertEqual(self.client.get(self.progress_url).data["total_pages"], 600)
+
+    # Editions: Primary edition deleted (valid - falls back to another edition)
+    def test_total_pages_after_edition_delete(self):
+        """Test that deleting the primary edition falls back to the remaining one"""
+        self.assertEqual(self.client.get(self.progress_url).data["total_pages"], 300)
+
+        self.paperback.delete()
+
+        response = self.client.get(self.progress_url)
+        self.assertEqual(response.data["total_pages"], 100)
+        self.assertEqual(response.data["progress_percentage"], 30)
+
+    # Editions: No editions (valid - no page count, 0%)
+    def test_total_pages_without_editions(self):
+        """Test that a book with no editions reports no page count"""
+        Edition.objects.filter(book=self.book).delete()
+
+        response = self.client.get(self.progress_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data["total_pages"])
+        self.assertEqual(response.data["progress_percentage"], 0)
+
+### Equivalent Classes for Progress ETags ###
+##  Conditional Request ##
+#       No If-None-Match                    (valid - 200 with ETag)
+#       If-None-Match matches               (valid - 304)
+#       If-None-Match is stale              (valid - 200 with new ETag)
+
+class ProgressETagTests(BaseProgressFixtures):
+    """
+    Test Module for conditional progress reads based on listed equivalence classes
+    """
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Additional setup for ETag tests: URL resolved once per class
+        """
+        super().setUpTestData()
+        cls.progress_url = reverse("get-book-progress", kwargs={"book_id": cls.book.book_id})
+
+    # Conditional Request: No If-None-Match (valid - 200 with ETag)
+    def test_etag_is_stable(self):
+        """Test that repeated reads of unchanged progress return the same ETag"""
+        first = self.client.get(self.progress_url)
+        second = self.client.get(self.progress_url)
+
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertTrue(first["ETag"])
+        self.assertEqual(first["ETag"], second["ETag"])
+
+    # Conditional Request: If-None-Match matches (valid - 304)
+    def test_matching_if_none_match(self):
+        """Test that a matching If-None-Match gets 304 with the same ETag"""
+        etag = self.client.get(self.progress_url)["ETag"]
+
+        response = self.client.get(self.progress_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+    # Conditional Request: If-None-Match is stale (valid - 200 with new ETag)
+    def test_etag_changes_after_page_update(self):
+        """Test that writing a new page changes the ETag and a stale one gets a full response"""
+        etag = self.client.get(self.progress_url)["ETag"]
+
+        post_response = self.client.post(self.progress_url, {"page_num": 45}, format="json")
+        response = self.client.get(self.progress_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response["ETag"], post_response["ETag"])
+        self.assertEqual(response.data["page_num"], 45)
\ No newline at end of file
@@ -1,7 +1,8 @@
 from django.urls import path
-from .views import UpdateUserBookProgressView, GetUserBookProgressView
+from .views import UserBookProgressView, BulkUpdateUserBookProgressView
 
 urlpatterns = [
-    path('update-progress/', UpdateUserBookProgressView.as_view(), name='update-book-progress'),
-    path('<str:book_id>/progress/', GetUserBookProgressView.as_view(), name='get-book-progress'),
+    path('update-progress/', UserBookProgressView.as_view(http_method_names=['post', 'options']), name='update-book-progress'),
+    path('update-progress/bulk/', BulkUpdateUserBookProgressView.as_view(), name='bulk-update-book-progress'),
+    path('<str:book_id>/progress/', UserBookProgressView.as_view(), name='get-book-progress'),
 ]
\ No newline at end of file
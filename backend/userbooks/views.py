@@ -1,85 +1,170 @@
+import hashlib
+from collections.abc import Mapping
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status, permissions
-from library.models import UserBook
+from django.db.models import OuterRef, Subquery
+from django.utils.cache import get_conditional_response
+from library.models import UserBook, Edition
 from .serializers import UserBookProgressSerializer
 
-class UpdateUserBookProgressView(APIView):
+def total_pages_subquery():
     """
-    API view for updating a user's reading progress (page_num) for a book.
+    Subquery for the page count of a UserBook's book: its primary edition's,
+    falling back to its first edition's, or None if it has no editions.
     """
-    permission_classes = [permissions.IsAuthenticated]
-    
-    def post(self, request):
-        serializer = UserBookProgressSerializer(
-            data=request.data,
-            context={'user': request.user}
-        )
-        
-        if serializer.is_valid():
-            book_id = serializer.validated_data['book_id']
-            page_num = serializer.validated_data['page_num']
-            
-            try:
-                # Get the UserBook record and update page_num
-                user_book = UserBook.objects.get(
-                    user=request.user, 
-                    book__book_id=book_id
-                )
-                user_book.page_num = page_num
-                user_book.save()
-                
-                return Response({
-                    "success": True,
-                    "book_id": book_id,
-                    "page_num": page_num,
-                    "total_pages": getattr(user_book.book.editions.first(), 'page_count', None)
-                })
-                
-            except Exception as e:
-                return Response(
-                    {"error": f"Failed to update reading progress: {str(e)}"},
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
-                )
-        
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    return Subquery(
+        Edition.objects.filter(
+            book_id=OuterRef('book_id')
+        ).order_by('-is_primary', *Edition._meta.ordering).values('page_count')[:1]
+    )
 
-class GetUserBookProgressView(APIView):
+class UserBookProgressView(APIView):
     """
-    API view for retrieving a user's reading progress for a book.
+    API view for retrieving (GET) and updating (POST) a user's reading
+    progress for a book.
+    
+    Path: /{book_id}/progress/, or /update-progress/ with book_id in the data
+    POST Data: {"page_num": n}
+    
+    Both methods return the same progress payload, so a client that updates
+    its progress doesn't need to read it back.
     """
     permission_classes = [permissions.IsAuthenticated]
     
-    def get(self, request, book_id):
+    def _fetch(self, request, book_id):
+        """
+        Get the user's UserBook for the book, loading only the fields the
+        progress payload uses and the book's total_pages, or None if they
+        aren't tracking it.
+        """
         try:
-            # Try to get the UserBook record
-            user_book = UserBook.objects.get(
+            return UserBook.objects.only('page_num', 'read_status').annotate(
+                total_pages=total_pages_subquery()
+            ).get(
                 user=request.user,
                 book__book_id=book_id
             )
-            
-            # Get total pages from the first edition (if available)
-            primary_edition = user_book.book.editions.filter(is_primary=True).first()
-            if not primary_edition:
-                primary_edition = user_book.book.editions.first()
-                
-            total_pages = getattr(primary_edition, 'page_count', None)
-            
-            return Response({
-                "book_id": book_id,
-                "page_num": user_book.page_num,
-                "read_status": user_book.read_status,
-                "total_pages": total_pages,
-                "progress_percentage": (user_book.page_num / total_pages * 100) if total_pages else 0
-            })
-            
         except UserBook.DoesNotExist:
+            return None
+    
+    def _progress_response(self, request, user_book, book_id, **extra):
+        """
+        Build the progress payload for a UserBook, tagged with an ETag of
+        everything it depends on. Answers a GET whose If-None-Match matches
+        with 304, since clients poll this endpoint.
+        """
+        total_pages = user_book.total_pages
+        
+        etag = '"%s"' % hashlib.sha256(
+            f"{user_book.pk}:{user_book.page_num}:{user_book.read_status}:{total_pages}".encode()
+        ).hexdigest()
+        if request.method == 'GET':
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                not_modified["ETag"] = etag
+                return not_modified
+        
+        response = Response({
+            **extra,
+            "book_id": book_id,
+            "page_num": user_book.page_num,
+            "read_status": user_book.read_status,
+            "total_pages": total_pages,
+            "progress_percentage": (user_book.page_num / total_pages * 100) if total_pages else 0
+        })
+        response["ETag"] = etag
+        return response
+    
+    def get(self, request, book_id):
+        user_book = self._fetch(request, book_id)
+        if user_book is None:
             return Response(
                 {"error": "You are not tracking this book"},
                 status=status.HTTP_404_NOT_FOUND
             )
-        except Exception as e:
+        
+        return self._progress_response(request, user_book, book_id)
+    
+    def post(self, request, book_id=None):
+        # A book_id in the URL takes the place of one in the data. Only a
+        # mapping can take it; any other body is left for the serializer to
+        # reject with a 400
+        data = request.data
+        if book_id is not None and isinstance(data, Mapping):
+            data = data.copy()
+            data['book_id'] = book_id
+        serializer = UserBookProgressSerializer(data=data)
+        
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        book_id = serializer.validated_data['book_id']
+        page_num = serializer.validated_data['page_num']
+        
+        user_book = self._fetch(request, book_id)
+        if user_book is None:
+            return Response(
+                {"book_id": ["You are not tracking this book. Add it to your shelves first."]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        # Clients resend the same page often, so only write when it changed,
+        # and then only the one column
+        if user_book.page_num != page_num:
+            UserBook.objects.filter(pk=user_book.pk).update(page_num=page_num)
+            user_book.page_num = page_num
+        
+        return self._progress_response(request, user_book, book_id, success=True)
+
+class BulkUpdateUserBookProgressView(APIView):
+    """
+    API view for updating a user's reading progress for several books at once,
+    e.g. when a client syncs after reading offline.
+    
+    Data: [{"book_id": id, "page_num": n}, ...]
+    
+    Every book must be tracked by the user, otherwise nothing is updated.
+    If a book_id appears more than once, the last page_num wins.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    
+    def post(self, request):
+        serializer = UserBookProgressSerializer(data=request.data, many=True, allow_empty=False)
+        
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        page_nums = {item['book_id']: item['page_num'] for item in serializer.validated_data}
+        
+        # Fetch every UserBook being updated in one query
+        user_books = list(
+            UserBook.objects.filter(
+                user=request.user,
+                book__book_id__in=page_nums
+            ).select_related('book').only('page_num', 'book__book_id')
+        )
+        
+        missing = sorted(set(page_nums) - {user_book.book.book_id for user_book in user_books})
+        if missing:
             return Response(
-                {"error": f"Failed to get reading progress: {str(e)}"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
\ No newline at end of file
+                {"book_id": [f"You are not tracking these books: {missing}. Add them to your shelves first."]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        # Only write the books whose page actually changed
+        changed = []
+        for user_book in user_books:
+            page_num = page_nums[user_book.book.book_id]
+            if user_book.page_num != page_num:
+                user_book.page_num = page_num
+                changed.append(user_book)
+        UserBook.objects.bulk_update(changed, ['page_num'], batch_size=500)
+        
+        return Response({
+            "success": True,
+            "progress": [
+                {"book_id": book_id, "page_num": page_num}
+                for book_id, page_num in page_nums.items()
+            ]
+        })
\ No newline at end of file